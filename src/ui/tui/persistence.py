@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,17 @@ except ImportError:
     PLATFORMDIRS_AVAILABLE = False
     logger.warning("platformdirs not available; settings persistence disabled")
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Last recent-files list read from or written to disk, keyed by its file path so
+# a different config dir never sees another's entries
+_recent_files_cache: tuple[Path, list[dict[str, Any]]] | None = None
+
 
 def get_config_dir() -> Path | None:
     """Get user configuration directory.
@@ -148,10 +160,14 @@ def save_settings(settings: dict[str, Any]) -> bool:
         return False
 
     settings_file = config_dir / "tui_settings.json"
+    tmp_file = settings_file.with_suffix(".json.tmp")
 
     try:
-        with open(settings_file, "w", encoding="utf-8") as f:
+        # Write to a sibling temp file and rename over the target so a crash
+        # mid-write never leaves a truncated settings file behind
+        with open(tmp_file, "w", encoding="utf-8") as f:
             json.dump(settings, f, indent=2, sort_keys=True)
+        tmp_file.replace(settings_file)
         return True
 
     except OSError as e:
@@ -159,14 +175,47 @@ def save_settings(settings: dict[str, Any]) -> bool:
         return False
 
 
-def load_recent_files(max_entries: int = 20) -> list[dict[str, Any]]:
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's error subclasses it)
+        OSError: If the file cannot be read
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write ``data`` as indented JSON, using orjson when it is installed.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_recent_files(max_entries: int = 20, *, force: bool = False) -> list[dict[str, Any]]:
     """Load recent files list.
 
+    The parsed list is cached in memory and kept current by
+    ``save_recent_files``, so only the first call (or ``force=True``) reads
+    the file from disk.
+
     Args:
         max_entries: Maximum number of recent files to return
+        force: Re-read the file from disk even if a cached list exists
 
     Returns:
-        List of recent file dictionaries (path, last_used, size_mb)
+        List of recent file dictionaries (path, name, last_used, size_mb)
 
     Example:
         >>> recent = load_recent_files()
@@ -177,22 +226,31 @@ def load_recent_files(max_entries: int = 20) -> list[dict[str, Any]]:
     if not config_dir:
         return []
 
+    global _recent_files_cache
+
     recent_file = config_dir / "recent_files.json"
 
-    if not recent_file.exists():
-        return []
+    if not force and _recent_files_cache is not None and _recent_files_cache[0] == recent_file:
+        files = _recent_files_cache[1]
+    else:
+        if not recent_file.exists():
+            return []
 
-    try:
-        with open(recent_file, encoding="utf-8") as f:
-            data = json.load(f)
+        try:
+            data = _read_json(recent_file)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load recent files from {recent_file}: {e}")
+            return []
 
         files = data.get("files", [])
+        _recent_files_cache = (recent_file, files)
 
+    try:
         # Filter out non-existent files and limit to max_entries
-        valid_files = [f for f in files if Path(f["path"]).exists()]
+        valid_files = [f for f in files if os.path.exists(f["path"])]
         return valid_files[:max_entries]
 
-    except (json.JSONDecodeError, OSError, KeyError) as e:
+    except KeyError as e:
         logger.warning(f"Failed to load recent files from {recent_file}: {e}")
         return []
 
@@ -211,12 +269,14 @@ def save_recent_files(files: list[dict[str, Any]], max_entries: int = 20) -> boo
     if not config_dir:
         return False
 
+    global _recent_files_cache
+
     recent_file = config_dir / "recent_files.json"
     payload = {"files": files[:max_entries], "max_entries": max_entries}
 
     try:
-        with open(recent_file, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        _write_json(recent_file, payload)
+        _recent_files_cache = (recent_file, payload["files"])
         return True
 
     except OSError as e:
@@ -244,8 +304,13 @@ def add_recent_file(file_path: Path) -> bool:
     # Load existing recent files
     existing = load_recent_files(max_entries=100)
 
+    # Stored paths are resolved strings, so duplicates are found by plain
+    # string comparison against the resolved path
+    resolved = file_path.resolve()
+    resolved_str = str(resolved)
+
     # Remove duplicate if exists
-    existing = [f for f in existing if Path(f["path"]) != file_path]
+    existing = [f for f in existing if f["path"] != resolved_str]
 
     # Add new entry at the front
     try:
@@ -254,7 +319,8 @@ def add_recent_file(file_path: Path) -> bool:
         size_mb = 0.0
 
     new_entry = {
-        "path": str(file_path.resolve()),
+        "path": resolved_str,
+        "name": resolved.name,
         "last_used": datetime.now().isoformat(),
         "size_mb": round(size_mb, 2),
     }
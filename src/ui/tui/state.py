@@ -4,27 +4,29 @@ from __future__ import annotations
 
 import dataclasses
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from ...models.events import Event
 
 if TYPE_CHECKING:
+    # Annotation-only: nothing resolves AppState's type hints at runtime
+    # (no get_type_hints/asdict), so this module never needs pathlib itself.
     from pathlib import Path
 
 
-class TruncationMarker(TypedDict):
-    """TypedDict for log truncation marker."""
+# Repeated Ctrl-C delivers several identical cancel events; reuse one message string
+_DEFAULT_CANCEL_REASON = "User interrupt"
+_DEFAULT_CANCEL_MSG = f"Cancelled: {_DEFAULT_CANCEL_REASON}"
 
-    truncated: bool
-    count: int
 
-
-@dataclass
-class LogEntry:
+class LogEntry(NamedTuple):
     """Represents a log entry in the UI.
 
+    Stored as a tuple (no per-instance ``__dict__``) to keep the 2000-entry
+    log ring compact; entries are immutable like the rest of the reducer state.
+
     Attributes:
-        type: Entry type (log, warning, error)
+        type: Entry type (log, warning, error, or truncated for ring-buffer gaps)
         timestamp: Unix timestamp
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         message: Log message content
@@ -68,40 +70,51 @@ class AppState:
     # Results
     artifacts: list[dict[str, str]] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
-    logs: list[LogEntry | TruncationMarker] = field(default_factory=list)
+    logs: list[LogEntry] = field(default_factory=list)
     summary: dict[str, Any] = field(default_factory=dict)
 
     # Run ID for event tracking
     run_id: str | None = None
     pending_run_config: dict[str, Any] | None = None
 
+    # Bumped by apply_event/reset_run_state whenever a displayed field changes,
+    # so views can skip repainting when an event batch changed nothing
+    version: int = 0
+
     def reset_run_state(self) -> None:
-        """Reset state for a new run."""
+        """Reset state for a new run.
+
+        The run containers are replaced rather than cleared in place: the
+        reducer shares them with earlier states and events (e.g. the
+        completion summary), so other holders keep seeing the finished run.
+        """
         self.is_running = False
         self.can_cancel = False
         self.current_stage = None
         self.current_progress = 0.0
         self.current_message = ""
-        self.stage_totals.clear()
-        self.stage_completed.clear()
-        self.stage_durations.clear()
-        self.artifacts.clear()
-        self.errors.clear()
-        self.logs.clear()
-        self.summary.clear()
+        self.stage_totals = {}
+        self.stage_completed = {}
+        self.stage_durations = {}
+        self.artifacts = []
+        self.errors = []
+        self.logs = []
+        self.summary = {}
         self.run_id = None
         self.pending_run_config = None
+        self.version += 1
 
 
-def _append_to_ring(items: list[Any], item: Any, max_size: int) -> list[Any]:
+def _append_to_ring(items: list[LogEntry], item: LogEntry, max_size: int) -> list[LogEntry]:
     """Append item to ring buffer with middle truncation.
 
     Maintains a ring buffer by keeping the first 25% and last 75% of entries
-    when the buffer exceeds max_size, with a truncation marker in between.
+    when the buffer exceeds max_size, with a ``type="truncated"`` LogEntry
+    marking the gap in between.
 
     Args:
-        items: Current list of items
-        item: New item to append
+        items: Current list of log entries
+        item: New entry to append
         max_size: Maximum buffer size
 
     Returns:
@@ -110,10 +123,10 @@ def _append_to_ring(items: list[Any], item: Any, max_size: int) -> list[Any]:
     Example:
         >>> logs = []
         >>> for i in range(3000):
-        ...     logs = _append_to_ring(logs, {"msg": f"Log {i}"}, 2000)
+        ...     logs = _append_to_ring(logs, LogEntry(message=f"Log {i}"), 2000)
         >>> len(logs)
         2000
-        >>> any(x.get("truncated") for x in logs)
+        >>> any(x.type == "truncated" for x in logs)
         True
     """
     result = [*items, item]
@@ -122,20 +135,49 @@ def _append_to_ring(items: list[Any], item: Any, max_size: int) -> list[Any]:
         # Keep first 25% and last 75% with truncation marker
         keep_head = max_size // 4
         keep_tail = max_size - keep_head - 1  # Reserve 1 slot for marker
+        count = len(result) - max_size + 1
 
-        return [
-            *result[:keep_head],
-            {"truncated": True, "count": len(result) - max_size + 1},
-            *result[-keep_tail:],
-        ]
+        # Stamp the marker with the oldest dropped entry, keeping the reducer pure
+        marker = LogEntry(
+            type="truncated",
+            timestamp=result[keep_head].timestamp,
+            message=f"{count} entries truncated",
+        )
+        return [*result[:keep_head], marker, *result[-keep_tail:]]
 
     return result
 
 
+def _replace(state: AppState, **changes: Any) -> AppState:
+    """Return a copy of ``state`` with ``changes`` applied and its version bumped."""
+    return dataclasses.replace(state, version=state.version + 1, **changes)
+
+
+def _replace_if_changed(state: AppState, **changes: Any) -> AppState:
+    """Return a copy of ``state`` with ``changes`` applied, or ``state`` itself.
+
+    Redundant events (a repeated ``cancelled`` or ``summary``, a progress tick
+    that reports the same numbers) leave every field as-is; returning the
+    original instance avoids allocating an identical AppState.
+
+    Args:
+        state: Current application state
+        **changes: Field values computed by the reducer branch
+
+    Returns:
+        ``state`` when every field already matches, otherwise a new AppState
+    """
+    for name, value in changes.items():
+        if getattr(state, name) != value:
+            return _replace(state, **changes)
+    return state
+
+
 def apply_event(state: AppState, event: Event) -> AppState:
     """Pure reducer function: (state, event) -> new_state.
 
-    Applies an event to the current state and returns a new state instance.
+    Applies an event to the current state and returns a new state instance,
+    or the input instance itself when the event changes nothing.
     NEVER mutates the input state.
 
     Args:
@@ -161,12 +203,22 @@ def apply_event(state: AppState, event: Event) -> AppState:
     # Match on event type
     if event_type == "stage_start":
         # data: {"description": str, "total": int}
-        return dataclasses.replace(
+        total = event_data.get("total", 100)
+        # First stage after reset_run_state() has nothing to carry over; skip the splat
+        stage_totals = (
+            {**state.stage_totals, event_stage: total}
+            if state.stage_totals
+            else {event_stage: total}
+        )
+        stage_completed = (
+            {**state.stage_completed, event_stage: 0} if state.stage_completed else {event_stage: 0}
+        )
+        return _replace_if_changed(
             state,
             current_stage=event_stage,
             current_message=event_data.get("description", ""),
-            stage_totals={**state.stage_totals, event_stage: event_data.get("total", 100)},
-            stage_completed={**state.stage_completed, event_stage: 0},
+            stage_totals=stage_totals,
+            stage_completed=stage_completed,
             is_running=True,
             can_cancel=True,
         )
@@ -181,9 +233,14 @@ def apply_event(state: AppState, event: Event) -> AppState:
         if total != state.stage_totals.get(event_stage):
             new_totals = {**state.stage_totals, event_stage: total}
 
-        return dataclasses.replace(
+        # Only copy the completed map when this stage's count actually moved
+        new_completed = state.stage_completed
+        if completed != state.stage_completed.get(event_stage):
+            new_completed = {**state.stage_completed, event_stage: completed}
+
+        return _replace_if_changed(
             state,
-            stage_completed={**state.stage_completed, event_stage: completed},
+            stage_completed=new_completed,
             stage_totals=new_totals,
             current_message=event_data.get("message", state.current_message),
             current_progress=(completed / total * 100) if total > 0 else 0,
@@ -191,7 +248,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
 
     elif event_type == "stage_end":
         # data: {"duration": float, "status": str}
-        return dataclasses.replace(
+        return _replace_if_changed(
             state,
             stage_durations={**state.stage_durations, event_stage: event_data.get("duration", 0.0)},
             current_stage=None,
@@ -200,7 +257,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
 
     elif event_type == "artifact":
         # data: {"kind": str, "path": str}
-        return dataclasses.replace(
+        return _replace(
             state,
             artifacts=[*state.artifacts, event_data],
         )
@@ -214,7 +271,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
             message=event_data.get("message", ""),
             logger=event_data.get("logger", ""),
         )
-        return dataclasses.replace(
+        return _replace(
             state,
             logs=_append_to_ring(state.logs, log_entry, max_size=2000),
         )
@@ -228,7 +285,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
             message=event_data.get("message", ""),
             logger=event_data.get("logger", ""),
         )
-        return dataclasses.replace(
+        return _replace(
             state,
             logs=_append_to_ring(state.logs, log_entry, max_size=2000),
         )
@@ -243,7 +300,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
             message=error_msg,
             logger=event_data.get("logger", ""),
         )
-        return dataclasses.replace(
+        return _replace(
             state,
             errors=[*state.errors, error_msg],
             logs=_append_to_ring(state.logs, log_entry, max_size=2000),
@@ -251,7 +308,7 @@ def apply_event(state: AppState, event: Event) -> AppState:
 
     elif event_type == "summary":
         # data: {"metrics": dict, "provider": str, "output_dir": str}
-        return dataclasses.replace(
+        return _replace_if_changed(
             state,
             summary=event_data,
             is_running=False,
@@ -260,12 +317,16 @@ def apply_event(state: AppState, event: Event) -> AppState:
 
     elif event_type == "cancelled":
         # data: {"reason": str}
-        reason = event_data.get("reason", "User interrupt")
-        return dataclasses.replace(
+        reason = event_data.get("reason")
+        if reason is None or reason == _DEFAULT_CANCEL_REASON:
+            message = _DEFAULT_CANCEL_MSG
+        else:
+            message = f"Cancelled: {reason}"
+        return _replace_if_changed(
             state,
             is_running=False,
             can_cancel=False,
-            current_message=f"Cancelled: {reason}",
+            current_message=message,
         )
 
     # Unknown event type; preserve state
@@ -11,8 +11,18 @@ try:
     from .home import HomeScreen
     from .run import RunScreen
     from .theme_selector import ThemeSelectorScreen
+    from .url_downloads import UrlDownloadsScreen
 
-    __all__.extend(["ConfigScreen", "HelpScreen", "HomeScreen", "RunScreen", "ThemeSelectorScreen"])
+    __all__.extend(
+        [
+            "ConfigScreen",
+            "HelpScreen",
+            "HomeScreen",
+            "RunScreen",
+            "ThemeSelectorScreen",
+            "UrlDownloadsScreen",
+        ]
+    )
 except ImportError:
     # Textual not installed
     pass
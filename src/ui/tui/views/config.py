@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from textual._context import active_app
-from textual.containers import Container, Horizontal, Vertical, VerticalScroll
 from textual.screen import Screen
-from textual.widgets import Button, Checkbox, Footer, Header, Input, Label, Select
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
+    from textual.widgets import Button, Checkbox, Input, Select
 
 from ..persistence import default_settings as _default_settings
 from ..persistence import load_settings, save_settings
@@ -25,6 +26,44 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Delay before auto-saving settings, so a burst of edits coalesces into one write
+SAVE_DEBOUNCE_SECONDS = 0.3
+
+# Select options are constant; build them once instead of on every compose()
+_QUALITY_OPTS: tuple[tuple[str, str], ...] = (
+    ("Speech (optimized for transcription)", "speech"),
+    ("Standard (balanced quality)", "standard"),
+    ("High (best quality)", "high"),
+    ("Compressed (smaller files)", "compressed"),
+)
+_PROVIDER_OPTS: tuple[tuple[str, str], ...] = (
+    ("Auto (automatic selection)", "auto"),
+    ("Deepgram Nova 3 (cloud, best quality)", "deepgram"),
+    ("ElevenLabs (cloud)", "elevenlabs"),
+    ("Whisper (local, no API key)", "whisper"),
+    ("Parakeet (local, no API key)", "parakeet"),
+)
+_LANGUAGE_OPTS: tuple[tuple[str, str], ...] = (
+    ("English", "en"),
+    ("Spanish", "es"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Italian", "it"),
+    ("Portuguese", "pt"),
+)
+_STYLE_OPTS: tuple[tuple[str, str], ...] = (
+    ("Concise (single comprehensive file)", "concise"),
+    ("Full (5 detailed analysis files)", "full"),
+)
+
+# Select id -> (AppState attribute, settings["defaults"] key)
+_SELECT_MAP: dict[str, tuple[str, str]] = {
+    "quality-select": ("quality", "quality"),
+    "provider-select": ("provider", "provider"),
+    "language-select": ("language", "language"),
+    "style-select": ("analysis_style", "analysis_style"),
+}
+
 
 class ConfigScreen(Screen):
     """Configuration screen for pipeline settings.
@@ -107,6 +146,19 @@ class ConfigScreen(Screen):
         super().__init__()
         self.settings = load_settings()
         self._app_override: AudioExtractionApp | None = None
+        # Raw output-dir text typed since mount; turned into a Path on start
+        self._pending_output_dir: str | None = None
+        self._save_timer: Timer | None = None
+        self._settings_dirty = False
+        # Fingerprint of the settings as last loaded/saved, to skip no-op writes
+        self._settings_hash = self._hash_settings()
+        # Form widgets, looked up once on mount
+        self._w_quality: Select | None = None
+        self._w_provider: Select | None = None
+        self._w_language: Select | None = None
+        self._w_style: Select | None = None
+        self._w_output: Input | None = None
+        self._w_keep: Checkbox | None = None
 
     @property
     def app(self) -> AudioExtractionApp:
@@ -121,6 +173,10 @@ class ConfigScreen(Screen):
 
     def compose(self) -> ComposeResult:
         """Compose the config screen layout."""
+        # Widget modules are imported here so importing this view stays cheap
+        from textual.containers import Container, Horizontal, VerticalScroll
+        from textual.widgets import Button, Checkbox, Footer, Header, Input, Label, Select
+
         yield Header()
         yield Label("Configure Pipeline", id="config-title")
 
@@ -128,12 +184,7 @@ class ConfigScreen(Screen):
             Label("Audio Quality", classes="config-label"),
             Label("[dim]Choose extraction quality preset[/dim]", classes="config-help"),
             Select(
-                options=[
-                    ("Speech (optimized for transcription)", "speech"),
-                    ("Standard (balanced quality)", "standard"),
-                    ("High (best quality)", "high"),
-                    ("Compressed (smaller files)", "compressed"),
-                ],
+                options=_QUALITY_OPTS,
                 value=self.settings["defaults"]["quality"],
                 id="quality-select",
             ),
@@ -147,13 +198,7 @@ class ConfigScreen(Screen):
                 classes="config-help",
             ),
             Select(
-                options=[
-                    ("Auto (automatic selection)", "auto"),
-                    ("Deepgram Nova 3 (cloud, best quality)", "deepgram"),
-                    ("ElevenLabs (cloud)", "elevenlabs"),
-                    ("Whisper (local, no API key)", "whisper"),
-                    ("Parakeet (local, no API key)", "parakeet"),
-                ],
+                options=_PROVIDER_OPTS,
                 value=self.settings["defaults"]["provider"],
                 id="provider-select",
             ),
@@ -164,14 +209,7 @@ class ConfigScreen(Screen):
             Label("Language", classes="config-label"),
             Label("[dim]Primary language of the audio content[/dim]", classes="config-help"),
             Select(
-                options=[
-                    ("English", "en"),
-                    ("Spanish", "es"),
-                    ("French", "fr"),
-                    ("German", "de"),
-                    ("Italian", "it"),
-                    ("Portuguese", "pt"),
-                ],
+                options=_LANGUAGE_OPTS,
                 value=self.settings["defaults"]["language"],
                 id="language-select",
             ),
@@ -185,10 +223,7 @@ class ConfigScreen(Screen):
                 classes="config-help",
             ),
             Select(
-                options=[
-                    ("Concise (single comprehensive file)", "concise"),
-                    ("Full (5 detailed analysis files)", "full"),
-                ],
+                options=_STYLE_OPTS,
                 value=self.settings["defaults"]["analysis_style"],
                 id="style-select",
             ),
@@ -248,6 +283,8 @@ class ConfigScreen(Screen):
 
     def on_mount(self) -> None:
         """Set up the screen on mount."""
+        from textual.widgets import Checkbox, Input, Select
+
         # Update app state with loaded settings
         self.app.state.quality = self.settings["defaults"]["quality"]
         self.app.state.provider = self.settings["defaults"]["provider"]
@@ -257,33 +294,33 @@ class ConfigScreen(Screen):
         if self.app.state.output_dir is None:
             self.app.state.output_dir = Path(self.settings["last_output_dir"])
 
+        self._w_quality = self.query_one("#quality-select", Select)
+        self._w_provider = self.query_one("#provider-select", Select)
+        self._w_language = self.query_one("#language-select", Select)
+        self._w_style = self.query_one("#style-select", Select)
+        self._w_output = self.query_one("#output-dir-input", Input)
+        self._w_keep = self.query_one("#keep-videos-checkbox", Checkbox)
+
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle selection changes and auto-save.
 
         Args:
             event: Selection changed event
         """
-        # Update app state
-        select_id = event.select.id
-
-        if select_id == "quality-select":
-            self.app.state.quality = str(event.value)
-            self.settings["defaults"]["quality"] = str(event.value)
-
-        elif select_id == "provider-select":
-            self.app.state.provider = str(event.value)
-            self.settings["defaults"]["provider"] = str(event.value)
-
-        elif select_id == "language-select":
-            self.app.state.language = str(event.value)
-            self.settings["defaults"]["language"] = str(event.value)
+        mapping = _SELECT_MAP.get(event.select.id)
+        if mapping is None:
+            return
 
-        elif select_id == "style-select":
-            self.app.state.analysis_style = str(event.value)
-            self.settings["defaults"]["analysis_style"] = str(event.value)
+        state_attr, key = mapping
+        value = str(event.value)
+        setattr(self.app.state, state_attr, value)
+        # Programmatic assignments (e.g. reset) echo back the stored value
+        if self.settings["defaults"][key] == value:
+            return
+        self.settings["defaults"][key] = value
 
         # Auto-save settings
-        save_settings(self.settings)
+        self._schedule_save()
 
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle input changes.
@@ -292,11 +329,13 @@ class ConfigScreen(Screen):
             event: Input changed event
         """
         if event.input.id == "output-dir-input":
-            output_path = Path(event.value)
-            self.app.state.output_dir = output_path
-            self.settings["last_output_dir"] = str(output_path)
+            # Keep the raw string on the keystroke path; Path is built in action_start_run
+            self._pending_output_dir = event.value
+            if self.settings["last_output_dir"] == event.value:
+                return
+            self.settings["last_output_dir"] = event.value
             # Auto-save settings
-            save_settings(self.settings)
+            self._schedule_save()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
@@ -318,7 +357,45 @@ class ConfigScreen(Screen):
         elif event.button.id == "keep-videos-checkbox":
             # Mirror checkbox value into settings
             self.settings["defaults"]["keep_downloaded_videos"] = bool(event.button.value)
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)start the debounced flush timer.
+
+        Rapid edits keep pushing the timer back, so a burst of changes ends
+        in a single settings write.
+        """
+        self._settings_dirty = True
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._save_timer = self.set_timer(SAVE_DEBOUNCE_SECONDS, self._flush_settings)
+
+    def _hash_settings(self) -> int:
+        """Return a fingerprint of the current settings contents."""
+        return hash(json.dumps(self.settings, sort_keys=True))
+
+    def _flush_settings(self) -> None:
+        """Write settings to disk if they differ from what was last saved."""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+            self._save_timer = None
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+
+        # Edits that end up back at the saved values don't need a write
+        settings_hash = self._hash_settings()
+        if settings_hash != self._settings_hash:
             save_settings(self.settings)
+            self._settings_hash = settings_hash
+
+    def on_screen_suspend(self) -> None:
+        """Flush pending edits when navigating away from the screen."""
+        self._flush_settings()
+
+    def on_unmount(self) -> None:
+        """Flush pending edits before the screen is removed."""
+        self._flush_settings()
 
     def action_start_run(self) -> None:
         """Start the pipeline run."""
@@ -327,12 +404,16 @@ class ConfigScreen(Screen):
             self.notify("No input file selected!", severity="error", timeout=3)
             return
 
+        if self._pending_output_dir is not None:
+            self.app.state.output_dir = Path(self._pending_output_dir)
+            self._pending_output_dir = None
+
         if self.app.state.output_dir is None:
             self.notify("Output directory not set!", severity="error", timeout=3)
             return
 
-        # Save current settings
-        save_settings(self.settings)
+        # Save current settings (no-op when nothing changed since the last write)
+        self._flush_settings()
 
         keep_videos = bool(self.settings["defaults"].get("keep_downloaded_videos", False))
 
@@ -356,16 +437,29 @@ class ConfigScreen(Screen):
     def action_reset_defaults(self) -> None:
         """Reset configuration to defaults."""
         self.settings = default_settings()
-        save_settings(self.settings)
-
-        # Reset UI selects
-        self.query_one("#quality-select", Select).value = self.settings["defaults"]["quality"]
-        self.query_one("#provider-select", Select).value = self.settings["defaults"]["provider"]
-        self.query_one("#language-select", Select).value = self.settings["defaults"]["language"]
-        self.query_one("#style-select", Select).value = self.settings["defaults"]["analysis_style"]
-        self.query_one("#output-dir-input", Input).value = self.settings["last_output_dir"]
-        keep_default = bool(self.settings["defaults"].get("keep_downloaded_videos", False))
-        self.query_one("#keep-videos-checkbox", Checkbox).value = keep_default
+        self._settings_dirty = True
+        self._flush_settings()
+
+        # Reset UI widgets through the references cached in on_mount
+        quality, provider, language = self._w_quality, self._w_provider, self._w_language
+        style, output, keep = self._w_style, self._w_output, self._w_keep
+        if (
+            quality is None
+            or provider is None
+            or language is None
+            or style is None
+            or output is None
+            or keep is None
+        ):
+            return  # Not mounted yet; the form is built from the new settings
+
+        defaults = self.settings["defaults"]
+        quality.value = defaults["quality"]
+        provider.value = defaults["provider"]
+        language.value = defaults["language"]
+        style.value = defaults["analysis_style"]
+        output.value = self.settings["last_output_dir"]
+        keep.value = bool(defaults.get("keep_downloaded_videos", False))
 
         self.notify("Configuration reset to defaults", severity="information", timeout=2)
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
@@ -13,6 +15,7 @@ from textual.widgets import Button, DataTable, Footer, Header, Input, Label
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
 from ..persistence import add_recent_file, load_recent_files
 from ..widgets.filtered_tree import FilteredDirectoryTree
@@ -22,6 +25,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Delay before re-filtering the tree, so a burst of keystrokes reloads it once
+FILTER_DEBOUNCE_SECONDS = 0.15
+
 
 class HomeScreen(Screen):
     """Home screen for file selection.
@@ -106,6 +112,11 @@ class HomeScreen(Screen):
         self.initial_path = path or Path.home()
         self._active_pane = "tree"  # "tree" or "recent"
         self._app_override: AudioExtractionApp | None = None
+        self._filter_timer: Timer | None = None
+        # Widgets looked up on first use and reused until unmount
+        self._w_tree: FilteredDirectoryTree | None = None
+        self._w_recent: DataTable | None = None
+        self._w_filter: Input | None = None
 
     @property
     def start_dir(self) -> Path:
@@ -155,39 +166,74 @@ class HomeScreen(Screen):
     def on_mount(self) -> None:
         """Set up the screen on mount."""
         # Configure recent files table
-        table = self.query_one("#recent-table", DataTable)
+        table = self._recent_table()
         table.add_columns("File", "Size", "Last Used")
         table.cursor_type = "row"
 
         self._load_recent_files()
 
         # Focus the file tree initially
-        self.query_one("#file-tree").focus()
-
-    def _load_recent_files(self) -> None:
-        """Load and display recent files in table."""
-        table = self.query_one("#recent-table", DataTable)
-        table.clear()
+        self._file_tree().focus()
+
+    def on_unmount(self) -> None:
+        """Drop cached widget references along with the DOM they belong to."""
+        self._w_tree = None
+        self._w_recent = None
+        self._w_filter = None
+
+    def _file_tree(self) -> FilteredDirectoryTree:
+        """Return the directory tree widget, querying the DOM only once."""
+        if self._w_tree is None:
+            self._w_tree = self.query_one("#file-tree", FilteredDirectoryTree)
+        return self._w_tree
+
+    def _recent_table(self) -> DataTable:
+        """Return the recent files table, querying the DOM only once."""
+        if self._w_recent is None:
+            self._w_recent = self.query_one("#recent-table", DataTable)
+        return self._w_recent
+
+    def _filter_input(self) -> Input:
+        """Return the filter input, querying the DOM only once."""
+        if self._w_filter is None:
+            self._w_filter = self.query_one("#filter-input", Input)
+        return self._w_filter
+
+    def _load_recent_files(self, *, force: bool = False) -> None:
+        """Load and display recent files in table.
 
-        recent = load_recent_files(max_entries=20)
-
-        if not recent:
-            table.add_row("[dim]No recent files[/dim]", "", "", key="none")
-            return
+        Args:
+            force: Re-read the recent files list from disk instead of the cache
+        """
+        table = self._recent_table()
+        recent = load_recent_files(max_entries=20, force=force)
 
+        # Prepare every row before touching the table, then apply the clear and
+        # inserts as one batch so the screen repaints once rather than per row
+        rows = []
         for file_data in recent:
-            path = Path(file_data["path"])
-            name = path.name
+            path = file_data["path"]
+            # Entries saved before "name" was recorded fall back to the path's basename
+            name = file_data.get("name") or os.path.basename(path)
             size = f"{file_data['size_mb']:.1f} MB"
             # Simplify timestamp to just date
             last_used = file_data["last_used"][:10]  # YYYY-MM-DD
+            rows.append((name, size, last_used, path))
 
-            table.add_row(name, size, last_used, key=str(path))
+        with self.app.batch_update():
+            table.clear()
+
+            if not rows:
+                table.add_row("[dim]No recent files[/dim]", "", "", key="none")
+                return
+
+            for name, size, last_used, key in rows:
+                table.add_row(name, size, last_used, key=key)
 
     def action_select_file(self) -> None:
         """Handle file selection (Enter key)."""
         if self._active_pane == "tree":
-            tree = self.query_one("#file-tree", FilteredDirectoryTree)
+            tree = self._file_tree()
             node = tree.cursor_node
             if not node or not node.data:
                 self.notify("No file selected", severity="warning")
@@ -195,7 +241,7 @@ class HomeScreen(Screen):
             self._select_file(Path(node.data.path))
 
         elif self._active_pane == "recent":
-            table = self.query_one("#recent-table", DataTable)
+            table = self._recent_table()
             if table.cursor_row is None:
                 self.notify("No recent file selected", severity="warning")
                 return
@@ -240,18 +286,18 @@ class HomeScreen(Screen):
         """Switch focus between tree and recent files (Tab key)."""
         if self._active_pane == "tree":
             self._active_pane = "recent"
-            self.query_one("#recent-table").focus()
+            self._recent_table().focus()
         else:
             self._active_pane = "tree"
-            self.query_one("#file-tree").focus()
+            self._file_tree().focus()
 
     def action_filter(self) -> None:
         """Focus the filter input (/ key)."""
-        self.query_one("#filter-input").focus()
+        self._filter_input().focus()
 
     def action_refresh_recent(self) -> None:
         """Refresh recent files list (r key)."""
-        self._load_recent_files()
+        self._load_recent_files(force=True)
         self.notify("Recent files refreshed", severity="information")
 
     def action_back(self) -> None:
@@ -296,12 +342,19 @@ class HomeScreen(Screen):
             self.notify("No recent file selected", severity="warning")
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Dynamically filter the directory tree as the user types."""
+        """Dynamically filter the directory tree as the user types.
+
+        The tree reload is debounced so only the last keystroke of a burst
+        re-filters it.
+        """
         if event.input.id != "filter-input":
             return
 
-        tree = self.query_one("#file-tree", FilteredDirectoryTree)
-        tree.filter = event.value or ""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            FILTER_DEBOUNCE_SECONDS, functools.partial(self._apply_filter, event.value or "")
+        )
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Filter the directory tree when the filter input is submitted."""
@@ -309,5 +362,13 @@ class HomeScreen(Screen):
         if event.input.id != "filter-input":
             return
 
-        tree = self.query_one("#file-tree", FilteredDirectoryTree)
-        tree.filter = event.value or ""
+        self._apply_filter(event.value or "")
+
+    def _apply_filter(self, pattern: str) -> None:
+        """Cancel any pending debounced filter and apply ``pattern`` to the tree."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
+
+        tree = self._file_tree()
+        tree.filter = pattern
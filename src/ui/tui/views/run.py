@@ -4,18 +4,22 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
-from rich.panel import Panel
+from textual import work
 from textual._context import active_app
 from textual.binding import Binding
-from textual.containers import Container, Horizontal, Vertical
+from textual.containers import Container, Horizontal
 from textual.css.query import NoMatches
 from textual.screen import Screen
-from textual.widgets import Button, Footer, Header, Static
+from textual.widgets import Button, Footer, Header
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
 from ..events import EventConsumer, EventConsumerConfig
 from ..services import open_path, run_pipeline
@@ -23,7 +27,9 @@ from ..widgets import LogPanel, ProgressBoard
 
 if TYPE_CHECKING:
     from ..app import AudioExtractionApp
-    from ..state import AppState
+
+# Upper bound on how often event batches repaint the progress board and logs
+DISPLAY_UPDATE_INTERVAL_SECONDS = 1 / 20
 
 
 class RunScreen(Screen):
@@ -116,14 +122,18 @@ class RunScreen(Screen):
         """
         super().__init__(**kwargs)
         self.input_file = Path(input_file) if input_file else None
-        self.config = dict(config) if config else None
+        # Read-only view rather than a copy; the screen never mutates its config
+        self.config: Mapping[str, Any] | None = MappingProxyType(config) if config else None
         self._event_consumer: EventConsumer | None = None
-        self._pipeline_task: asyncio.Task | None = None
-        self._monitor_task: asyncio.Task | None = None
-        self._consume_task: asyncio.Task | None = None
         self._running = False
         self._output_dir: Path | None = None
         self._app_override: AudioExtractionApp | None = None
+        # Progress board and log panel, mounted when the first display update runs
+        self._w_progress: ProgressBoard | None = None
+        self._w_logs: LogPanel | None = None
+        # Set by event batches, cleared when the refresh interval repaints
+        self._pending_update = False
+        self._display_timer: Timer | None = None
 
     @property
     def app(self) -> AudioExtractionApp:
@@ -140,9 +150,11 @@ class RunScreen(Screen):
         """Compose the run screen layout."""
         yield Header()
 
-        yield Container(ProgressBoard(id="progress-board"), id="progress-container")
+        # The progress board and log panel are mounted into these on the first
+        # display update, so pushing the screen only lays out empty containers
+        yield Container(id="progress-container")
 
-        yield Container(LogPanel(id="log-panel"), id="log-container")
+        yield Container(id="log-container")
 
         controls = Horizontal(
             Button("Cancel", variant="error", id="cancel-btn"),
@@ -155,20 +167,31 @@ class RunScreen(Screen):
 
     def on_mount(self) -> None:
         """Start pipeline when screen mounts."""
-        # Start pipeline after mount
-        self.app.call_later(self._start_pipeline_async)
+        # Runs as a worker owned by this screen, so unmounting cancels it
+        self._start_pipeline()
 
-    def _start_pipeline_async(self) -> None:
-        """Create async task to start pipeline."""
-        self._pipeline_task = asyncio.create_task(self._start_pipeline())
+    def on_unmount(self) -> None:
+        """Drop cached widget references along with the DOM they belong to."""
+        self._stop_display_timer()
+        self._w_progress = None
+        self._w_logs = None
 
+    @work(exclusive=True, group="pipeline")
     async def _start_pipeline(self) -> None:
-        """Start the pipeline in background."""
+        """Run the pipeline and its event consumer until both finish."""
         import uuid
 
         from ..state import apply_event
 
-        self._ensure_runtime_context()
+        try:
+            self._ensure_runtime_context()
+        except RuntimeError as e:
+            # Report on the screen instead of letting the worker error close the app
+            self._running = False
+            self.notify(f"Cannot start pipeline: {e}", severity="error")
+            return
+        # Drop results from any previous run before streaming new events
+        self.app.state.reset_run_state()
         self._running = True
 
         consumer_config = EventConsumerConfig()
@@ -177,32 +200,54 @@ class RunScreen(Screen):
         # Define batch handler to update app state
         def handle_batch(events: list) -> None:
             """Process batch of events and update app state."""
+            last_version = self.app.state.version
             for event in events:
                 self.app.state = apply_event(self.app.state, event)
-            # Update UI after processing batch
-            self.app.call_from_thread(self._update_display)
+            # Request a repaint only if the batch changed something visible;
+            # bursts of batches share one display update
+            if self.app.state.version != last_version:
+                self._schedule_update()
 
         # Initialize event consumer with queue and handler
-        self._event_consumer = EventConsumer(
+        consumer = EventConsumer(
             queue=event_queue,
             on_batch=handle_batch,
             config=consumer_config,
         )
+        self._event_consumer = consumer
 
         # Generate run ID
         run_id = str(uuid.uuid4())
         self.app.state.run_id = run_id
 
-        # Create pipeline task with correct parameters
-        self._pipeline_task = asyncio.create_task(
-            self._run_pipeline_with_events(event_queue, run_id)
-        )
-
-        # Start event consumer
-        self._consume_task = asyncio.create_task(self._event_consumer.run())
-
-        # Monitor pipeline completion
-        self._monitor_task = asyncio.create_task(self._monitor_pipeline())
+        # Run the consumer and the pipeline as one structured group: cancelling
+        # this worker (action_cancel, unmount) cancels both children together
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(consumer.run())
+                tg.create_task(self._run_pipeline_then_stop_consumer(consumer, event_queue, run_id))
+        except* Exception as group:
+            # The pipeline reports its own errors; this is the consumer failing
+            self._running = False
+            self.notify(f"Pipeline failed: {group.exceptions[0]}", severity="error")
+        finally:
+            # Cancellation still propagates so the worker ends as cancelled;
+            # a run that has been superseded leaves the new run's consumer alone
+            if self._event_consumer is consumer:
+                self._event_consumer = None
+
+                # Update UI one final time
+                self._stop_display_timer()
+                self._update_display()
+
+    async def _run_pipeline_then_stop_consumer(
+        self, consumer: EventConsumer, event_queue: asyncio.Queue, run_id: str
+    ) -> None:
+        """Run the pipeline, then let this run's event consumer flush and exit."""
+        try:
+            await self._run_pipeline_with_events(event_queue, run_id)
+        finally:
+            await consumer.stop()
 
     async def _run_pipeline_with_events(
         self,
@@ -262,36 +307,58 @@ class RunScreen(Screen):
             if output_btn:
                 output_btn.disabled = False
 
-    async def _monitor_pipeline(self) -> None:
-        """Monitor pipeline and update UI."""
-        # Wait for pipeline to finish
-        if self._pipeline_task:
-            try:
-                await self._pipeline_task
-            except asyncio.CancelledError:
-                pass
-
-        # Stop event consumer
-        if self._event_consumer:
-            await self._event_consumer.stop()
-        if self._consume_task:
-            await self._consume_task
-        self._consume_task = None
-        self._event_consumer = None
-
-        # Update UI one final time
+    def _schedule_update(self) -> None:
+        """Mark the display stale and make sure the refresh interval is running."""
+        self._pending_update = True
+        if self._display_timer is None:
+            self._display_timer = self.set_interval(
+                DISPLAY_UPDATE_INTERVAL_SECONDS, self._flush_update
+            )
+
+    def _flush_update(self) -> None:
+        """Repaint the display if any batch arrived since the last repaint."""
+        if not self._pending_update:
+            return
+        self._pending_update = False
         self._update_display()
 
+    def _stop_display_timer(self) -> None:
+        """Stop the refresh interval and drop any pending repaint request."""
+        if self._display_timer is not None:
+            self._display_timer.stop()
+            self._display_timer = None
+        self._pending_update = False
+
     def _update_display(self) -> None:
         """Update progress board and logs from app state."""
+        widgets = self._mount_run_widgets()
+        if widgets is None:
+            return  # Screen already closed
+        progress_board, log_panel = widgets
+
         # Update progress board
-        progress_board = self.query_one("#progress-board", ProgressBoard)
         progress_board.update_display(self.app.state)
 
         # Update log panel
-        log_panel = self.query_one("#log-panel", LogPanel)
         log_panel.update_logs(self.app.state)
 
+    def _mount_run_widgets(self) -> tuple[ProgressBoard, LogPanel] | None:
+        """Return the progress board and log panel, mounting them on first use.
+
+        Returns None if the containers are no longer in the DOM.
+        """
+        if self._w_progress is None or self._w_logs is None:
+            try:
+                progress_container = self.query_one("#progress-container", Container)
+                log_container = self.query_one("#log-container", Container)
+            except NoMatches:
+                return None
+            self._w_progress = ProgressBoard(id="progress-board")
+            self._w_logs = LogPanel(id="log-panel")
+            progress_container.mount(self._w_progress)
+            log_container.mount(self._w_logs)
+        return self._w_progress, self._w_logs
+
     def _get_button(self, selector: str) -> Button | None:
         """Return a button if present in the DOM."""
 
@@ -321,11 +388,10 @@ class RunScreen(Screen):
             self.notify("Pipeline is not running", severity="warning")
             return
 
-        # Cancel pipeline task
-        if self._pipeline_task:
-            self._pipeline_task.cancel()
-            self._running = False
-            self.notify("Cancelling pipeline...", severity="warning")
+        # Cancel the pipeline worker
+        self.workers.cancel_group(self, "pipeline")
+        self._running = False
+        self.notify("Cancelling pipeline...", severity="warning")
 
         # Disable cancel button
         cancel_btn = self._get_button("#cancel-btn")
@@ -368,5 +434,6 @@ class RunScreen(Screen):
             config = getattr(self.app.state, "pending_run_config", None)
             if config is None:
                 raise RuntimeError("No pipeline configuration available for RunScreen")
-            self.config = dict(config)
+            # Ownership passes from the state to this screen, so no copy is needed
+            self.config = MappingProxyType(config)
             self.app.state.pending_run_config = None
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from typing import TYPE_CHECKING, cast
 
-from rich.text import Text
 from textual._context import active_app
 from textual.binding import Binding
-from textual.containers import Container, Vertical
+from textual.containers import Container
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Label, OptionList, Static
 from textual.widgets.option_list import Option
@@ -21,6 +22,58 @@ from ..themes import CUSTOM_THEMES
 if TYPE_CHECKING:
     from ..app import AudioExtractionApp
 
+# Namespace prefixes left out of display names
+_THEME_PREFIX_RE = re.compile(r"^(?:audio-extraction-|textual-)")
+
+# Emoji shown before our custom themes, keyed by a word in the theme name
+_CUSTOM_THEME_EMOJI = {
+    "blue": "🔵",
+    "purple": "🟣",
+    "green": "🟢",
+    "light": "☀️",
+}
+
+# Our themes, listed first; always registered, so never checked for availability
+_CUSTOM_THEME_NAMES: tuple[str, ...] = tuple(theme.name for theme in CUSTOM_THEMES)
+
+# Built-in Textual themes offered in the list, in display order
+_BUILTIN_DARK_THEMES: tuple[str, ...] = (
+    "nord",
+    "gruvbox",
+    "dracula",
+    "monokai",
+    "catppuccin-mocha",
+    "tokyo-night",
+    "textual-dark",
+)
+_BUILTIN_LIGHT_THEMES: tuple[str, ...] = (
+    "textual-light",
+    "catppuccin-latte",
+    "solarized-light",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_theme_name(theme_name: str) -> str:
+    """Format theme name for display.
+
+    Args:
+        theme_name: Internal theme name
+
+    Returns:
+        Formatted display name
+    """
+    # Remove prefixes, then capitalize the hyphen-separated words
+    formatted = _THEME_PREFIX_RE.sub("", theme_name).replace("-", " ").title()
+
+    # Add emoji indicators for our custom themes
+    if theme_name.startswith("audio-extraction"):
+        for keyword, emoji in _CUSTOM_THEME_EMOJI.items():
+            if keyword in theme_name:
+                return f"{emoji} {formatted}"
+
+    return formatted
+
 
 class ThemeSelectorScreen(Screen):
     """Screen for selecting application theme."""
@@ -61,6 +114,10 @@ class ThemeSelectorScreen(Screen):
         border: none;
     }
 
+    OptionList > .option-list--option-highlighted {
+        text-style: bold;
+    }
+
     #current-theme {
         text-align: center;
         color: $text-muted;
@@ -72,6 +129,8 @@ class ThemeSelectorScreen(Screen):
         """Initialize the theme selector screen."""
         super().__init__()
         self._app_override: AudioExtractionApp | None = None
+        # Theme name -> position in the option list, filled as options are built
+        self._theme_index: dict[str, int] = {}
 
     @property
     def app(self) -> AudioExtractionApp:
@@ -92,7 +151,7 @@ class ThemeSelectorScreen(Screen):
 
         with Container(id="theme-container"):
             yield Label("Select Theme", id="theme-title")
-            yield OptionList(id="theme-list")
+            yield OptionList(*self._theme_options(), id="theme-list")
             yield Static("", id="current-theme")
 
         yield Footer()
@@ -100,113 +159,67 @@ class ThemeSelectorScreen(Screen):
     def on_mount(self) -> None:
         """Initialize the theme list when screen is mounted."""
         option_list = self.query_one("#theme-list", OptionList)
-        current_theme = self.app.theme
+
+        # Update current theme display
+        self._update_current_theme_display()
+
+        # Focus on the option list
+        option_list.focus()
+
+        # Try to highlight the current theme
+        self._highlight_current_theme()
+
+    def _theme_options(self) -> list[Option]:
+        """Build every theme list entry, grouped under disabled separator options.
+
+        The list is handed to OptionList in one go so it measures its contents
+        once, rather than once per added option.
+        """
+        options: list[Option] = []
+        self._theme_index.clear()
+        available = frozenset(self.app.available_themes)
 
         # Add custom themes section
-        custom_theme_names = [theme.name for theme in CUSTOM_THEMES]
-        if custom_theme_names:
+        if _CUSTOM_THEME_NAMES:
             # Add a disabled option as a separator
-            option_list.add_option(Option("──── Custom Themes ────", disabled=True))
-            for theme_name in custom_theme_names:
-                display_name = self._format_theme_name(theme_name)
-                if theme_name == current_theme:
-                    display_name = f"▶ {display_name}"
-                option_list.add_option(Option(display_name, id=theme_name))
+            options.append(Option("──── Custom Themes ────", disabled=True))
+            for theme_name in _CUSTOM_THEME_NAMES:
+                self._theme_index[theme_name] = len(options)
+                options.append(Option(_format_theme_name(theme_name), id=theme_name))
 
         # Add built-in dark themes
-        dark_themes = [
-            "nord",
-            "gruvbox",
-            "dracula",
-            "monokai",
-            "catppuccin-mocha",
-            "tokyo-night",
-            "textual-dark",
-        ]
-        available_dark = [t for t in dark_themes if t in self.app.available_themes]
+        available_dark = [t for t in _BUILTIN_DARK_THEMES if t in available]
         if available_dark:
             # Add a disabled option as a separator
-            option_list.add_option(Option("──── Built-in Dark Themes ────", disabled=True))
+            options.append(Option("──── Built-in Dark Themes ────", disabled=True))
             for theme_name in available_dark:
-                display_name = self._format_theme_name(theme_name)
-                if theme_name == current_theme:
-                    display_name = f"▶ {display_name}"
-                option_list.add_option(Option(display_name, id=theme_name))
+                self._theme_index[theme_name] = len(options)
+                options.append(Option(_format_theme_name(theme_name), id=theme_name))
 
         # Add built-in light themes
-        light_themes = [
-            "textual-light",
-            "catppuccin-latte",
-            "solarized-light",
-        ]
-        available_light = [t for t in light_themes if t in self.app.available_themes]
+        available_light = [t for t in _BUILTIN_LIGHT_THEMES if t in available]
         if available_light:
             # Add a disabled option as a separator
-            option_list.add_option(Option("──── Built-in Light Themes ────", disabled=True))
+            options.append(Option("──── Built-in Light Themes ────", disabled=True))
             for theme_name in available_light:
-                display_name = self._format_theme_name(theme_name)
-                if theme_name == current_theme:
-                    display_name = f"▶ {display_name}"
-                option_list.add_option(Option(display_name, id=theme_name))
+                self._theme_index[theme_name] = len(options)
+                options.append(Option(_format_theme_name(theme_name), id=theme_name))
 
-        # Update current theme display
-        self._update_current_theme_display()
-
-        # Focus on the option list
-        option_list.focus()
-
-        # Try to highlight the current theme
-        self._highlight_current_theme()
-
-    def _format_theme_name(self, theme_name: str) -> str:
-        """Format theme name for display.
-
-        Args:
-            theme_name: Internal theme name
-
-        Returns:
-            Formatted display name
-        """
-        # Remove prefixes
-        name = theme_name.replace("audio-extraction-", "")
-        name = name.replace("textual-", "")
-        name = name.replace("-", " ")
-
-        # Capitalize words
-        words = name.split()
-        formatted = " ".join(word.capitalize() for word in words)
-
-        # Add emoji indicators for our custom themes
-        if theme_name.startswith("audio-extraction"):
-            if "blue" in theme_name:
-                formatted = f"🔵 {formatted}"
-            elif "purple" in theme_name:
-                formatted = f"🟣 {formatted}"
-            elif "green" in theme_name:
-                formatted = f"🟢 {formatted}"
-            elif "light" in theme_name:
-                formatted = f"☀️ {formatted}"
-
-        return formatted
+        return options
 
     def _update_current_theme_display(self) -> None:
         """Update the current theme display text."""
         current_theme_label = self.query_one("#current-theme", Static)
         current_theme = self.app.theme
-        formatted_name = self._format_theme_name(current_theme)
+        formatted_name = _format_theme_name(current_theme)
         current_theme_label.update(f"Current: {formatted_name}")
 
     def _highlight_current_theme(self) -> None:
         """Highlight the current theme in the list."""
         option_list = self.query_one("#theme-list", OptionList)
-        current_theme = self.app.theme
-
-        # Find and highlight the current theme option
-        for index in range(option_list.option_count):
-            option = option_list.get_option_at_index(index)
-            if option and hasattr(option, "id") and option.id == current_theme:
-                option_list.highlighted = index
-                break
+        index = self._theme_index.get(self.app.theme)
+        if index is not None:
+            option_list.highlighted = index
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle theme selection.
@@ -231,7 +244,7 @@ class ThemeSelectorScreen(Screen):
         save_settings(self.app.settings)
 
         # Show notification
-        formatted_name = self._format_theme_name(theme_name)
+        formatted_name = _format_theme_name(theme_name)
         self.app.notify(f"Theme changed to: {formatted_name}", severity="information")
 
         # Return to previous screen
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from textual._context import active_app
@@ -65,6 +64,8 @@ class UrlDownloadsScreen(Screen):
     def __init__(self) -> None:
         super().__init__()
         self._app_override: AudioExtractionApp | None = None
+        # URL input, looked up on first use and reused until unmount
+        self._w_url: Input | None = None
 
     @property
     def app(self) -> AudioExtractionApp:
@@ -104,7 +105,17 @@ class UrlDownloadsScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.query_one("#url-input", Input).focus()
+        self._url_input().focus()
+
+    def on_unmount(self) -> None:
+        """Drop the cached input reference along with the DOM it belongs to."""
+        self._w_url = None
+
+    def _url_input(self) -> Input:
+        """Return the URL input, querying the DOM only once."""
+        if self._w_url is None:
+            self._w_url = self.query_one("#url-input", Input)
+        return self._w_url
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         event.stop()
@@ -114,15 +125,14 @@ class UrlDownloadsScreen(Screen):
             self.action_back()
 
     def action_start_from_url(self) -> None:
-        url_input = self.query_one("#url-input", Input)
-        url = url_input.value.strip()
+        url = self._url_input().value.strip()
 
         if not url:
             self.notify("Please enter a URL.", severity="warning")
             return
 
         # Lightweight validation: must at least look like a URL
-        if not (url.startswith("http://") or url.startswith("https://")):
+        if not url.startswith(("http://", "https://")):
             self.notify("URL must start with http:// or https://", severity="error")
             return
 
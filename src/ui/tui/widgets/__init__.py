@@ -28,27 +28,16 @@ def _placeholder(name: str) -> type:
     return _Widget
 
 
+# Textual is all-or-nothing: if one widget module can't be imported, none can
 try:  # pragma: no cover - covered via higher-level tests
     from .filtered_tree import FilteredDirectoryTree
+    from .health_panel import HealthPanel
+    from .log_panel import LogPanel
+    from .progress_board import ProgressBoard
 except ImportError:  # Textual or related deps not installed
-    # type: ignore[misc] - Placeholder doesn't match full widget interface, but that's intentional
-    # for graceful degradation when Textual is not available
+    # type: ignore[misc] - Placeholders don't match the full widget interface, but that's
+    # intentional for graceful degradation when Textual is not available
     FilteredDirectoryTree = _placeholder("FilteredDirectoryTree")  # type: ignore[misc]
-
-try:  # pragma: no cover
-    from .health_panel import HealthPanel
-except ImportError:
-    # type: ignore[misc] - Same pattern as above: placeholder for optional dependency
     HealthPanel = _placeholder("HealthPanel")  # type: ignore[misc]
-
-try:  # pragma: no cover
-    from .log_panel import LogPanel
-except ImportError:
-    # type: ignore[misc] - Same pattern as above: placeholder for optional dependency
     LogPanel = _placeholder("LogPanel")  # type: ignore[misc]
-
-try:  # pragma: no cover
-    from .progress_board import ProgressBoard
-except ImportError:
-    # type: ignore[misc] - Same pattern as above: placeholder for optional dependency
     ProgressBoard = _placeholder("ProgressBoard")  # type: ignore[misc]
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import fnmatch
+import itertools
+import re
 from typing import TYPE_CHECKING
 
 from textual.widgets import DirectoryTree
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
+    from textual.widgets._directory_tree import DirEntry
+    from textual.widgets.tree import TreeNode
+
+# Most entries a filtered directory lists; the first ones in display order are kept
+MAX_FILTER_RESULTS = 500
+
 
 class FilteredDirectoryTree(DirectoryTree):
     """A DirectoryTree that supports dynamic filtering of paths."""
@@ -21,6 +30,7 @@ class FilteredDirectoryTree(DirectoryTree):
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
+        max_results: int = MAX_FILTER_RESULTS,
     ):
         """Initialize the filtered directory tree.
 
@@ -29,9 +39,14 @@ class FilteredDirectoryTree(DirectoryTree):
             name: Widget name
             id: Widget ID
             classes: CSS classes
+            max_results: Most matches listed per directory while a filter is set
         """
         super().__init__(path, name=name, id=id, classes=classes)
         self._filter_pattern: str = ""
+        self._max_results = max_results
+        # Tests a lowercased file name against the pattern; rebuilt by the setter
+        # so filtering makes no per-path decisions
+        self._matches_name: Callable[[str], object] = lambda name: True
 
     @property
     def filter(self) -> str:
@@ -47,9 +62,30 @@ class FilteredDirectoryTree(DirectoryTree):
         """
         if self._filter_pattern != pattern:
             self._filter_pattern = pattern
+            self._compile_filter(pattern)
             # Reload the tree to apply the new filter
             self.reload()
 
+    def _compile_filter(self, pattern: str) -> None:
+        """Precompute the matcher for ``pattern``.
+
+        Glob patterns (containing ``*`` or ``?``) are translated to one
+        case-insensitive regex matched against each file name; anything else
+        is a case-insensitive substring match.
+
+        Args:
+            pattern: Filter pattern (glob-style or substring)
+        """
+        if "*" in pattern or "?" in pattern:
+            try:
+                self._matches_name = re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+                return
+            except re.error:
+                # Fallback to substring matching if the glob can't be compiled
+                pass
+        pattern_lower = pattern.lower()
+        self._matches_name = lambda name: pattern_lower in name
+
     def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
         """Filter paths based on the current filter pattern.
 
@@ -57,33 +93,26 @@ class FilteredDirectoryTree(DirectoryTree):
             paths: The paths to filter
 
         Returns:
-            Filtered paths that match the pattern
+            Filtered paths that match the pattern, lazily
         """
         if not self._filter_pattern:
             # No filter, return all paths
             return paths
 
-        # Convert pattern to lowercase for case-insensitive matching
-        pattern_lower = self._filter_pattern.lower()
-
-        # Support both glob patterns and simple substring matching
-        filtered_paths = []
-        for path in paths:
-            path_str_lower = path.name.lower()
-
-            # Check for glob pattern
-            if "*" in self._filter_pattern or "?" in self._filter_pattern:
-                # Use glob-style matching
-                try:
-                    if path.match(self._filter_pattern):
-                        filtered_paths.append(path)
-                except Exception:
-                    # Fallback to substring matching if glob fails
-                    if pattern_lower in path_str_lower:
-                        filtered_paths.append(path)
-            else:
-                # Simple substring matching (case-insensitive)
-                if pattern_lower in path_str_lower:
-                    filtered_paths.append(path)
-
-        return filtered_paths
+        matches_name = self._matches_name
+        return (path for path in paths if matches_name(path.name.lower()))
+
+    def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
+        """Populate a directory node, listing at most ``max_results`` filtered matches.
+
+        The directory loader sorts the filtered paths before handing them
+        over, so the cap keeps the first matches in display order rather than
+        an arbitrary subset of the directory listing.
+
+        Args:
+            node: The tree node to populate
+            content: The sorted paths to list under the node
+        """
+        if self._filter_pattern:
+            content = itertools.islice(content, self._max_results)
+        super()._populate_node(node, content)
@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from typing import TYPE_CHECKING
 
 from rich.console import Group
 from rich.table import Table
 from rich.text import Text
-from textual.app import ComposeResult
 from textual.widgets import Static
 
-from ..services import HealthService
+if TYPE_CHECKING:
+    from ..services.health_service import HealthService
+
+# Automatic refreshes within this many seconds of the last check re-render its results
+HEALTH_RECHECK_SECONDS = 5.0
+
+# Static footer shared by every render; Group only reads it
+_FOOTER = Text("Auto-refreshes every 30s. Press 'r' to refresh manually.", style="dim")
+
+
+def _status_table() -> Table:
+    """Return an empty provider status table with its columns configured."""
+    table = Table(title="Provider Health Status", show_header=True)
+    table.add_column("Provider", style="cyan", width=12)
+    table.add_column("Status", width=10)
+    table.add_column("Response Time", width=15)
+    table.add_column("Details", no_wrap=False)
+    return table
 
 
 class HealthPanel(Static):
@@ -45,9 +63,14 @@ class HealthPanel(Static):
     def __init__(self, **kwargs):
         """Initialize health panel."""
         super().__init__(**kwargs)
-        self._health_service = HealthService()
+        # Imported here so screens that never show the panel don't load the service
+        from ..services.health_service import HealthService
+
+        self._health_service: HealthService = HealthService()
         self._health_status: dict[str, dict] = {}
         self._check_task: asyncio.Task | None = None
+        self._last_check_ts = 0.0
+        self._rendered_key: tuple | None = None  # Status fields behind the current table
 
     def on_mount(self) -> None:
         """Set up refresh timer on mount."""
@@ -57,16 +80,38 @@ class HealthPanel(Static):
         # Auto-refresh every 30 seconds
         self.set_interval(30.0, self.refresh_health)
 
-    def refresh_health(self) -> None:
-        """Refresh health status for all providers."""
+    def refresh_health(self, force: bool = False) -> None:
+        """Refresh health status for all providers.
+
+        Args:
+            force: Check the providers even if the last check is recent
+        """
+        # A check already in flight will render fresh results; don't start another
+        if self._check_task is not None and not self._check_task.done():
+            return
+
         # Run health check in background
-        self._check_task = asyncio.create_task(self._check_health())
+        self._check_task = asyncio.create_task(self._check_health(force))
+
+    async def _check_health(self, force: bool = False) -> None:
+        """Check health status asynchronously.
+
+        Args:
+            force: Check the providers even if the last check is recent
+        """
+        # Results this recent are still current; skip the provider round-trip
+        if (
+            not force
+            and self._health_status
+            and time.monotonic() - self._last_check_ts < HEALTH_RECHECK_SECONDS
+        ):
+            self._update_display()
+            return
 
-    async def _check_health(self) -> None:
-        """Check health status asynchronously."""
         try:
             results = await self._health_service.check_all_providers()
         except Exception as exc:  # pragma: no cover - defensive logging only
+            self._rendered_key = None
             self.update(f"[red]Error checking health: {exc}[/red]")
             return
 
@@ -87,53 +132,84 @@ class HealthPanel(Static):
             }
 
         self._health_status = normalized
+        self._last_check_ts = time.monotonic()
         self._update_display()
 
     def _update_display(self) -> None:
-        """Update the health status display."""
+        """Update the health status display.
+
+        Skipped when every rendered field matches the previous update.
+        """
+        key = self._display_key(self._health_status)
+        if key == self._rendered_key:
+            return
+        self._rendered_key = key
+
         if not self._health_status:
             self.update("[dim]No provider health data available.[/dim]")
             return
 
-        table = Table(title="Provider Health Status", show_header=True)
-        table.add_column("Provider", style="cyan", width=12)
-        table.add_column("Status", width=10)
-        table.add_column("Response Time", width=15)
-        table.add_column("Details", no_wrap=False)
-
-        for provider, status in self._health_status.items():
-            if status.get("healthy"):
-                status_text = "[green]✓ Healthy[/green]"
-            elif status.get("error"):
-                status_text = "[red]✗ Error[/red]"
-            else:
-                status_text = "[yellow]⚠ Degraded[/yellow]"
-
-            # Format response time
-            response_time = status.get("response_time")
-            if response_time is not None:
-                time_text = f"{response_time:.2f}s"
-                # Color code by speed
-                if response_time < 2.0:
-                    time_text = f"[green]{time_text}[/green]"
-                elif response_time < 5.0:
-                    time_text = f"[yellow]{time_text}[/yellow]"
-                else:
-                    time_text = f"[red]{time_text}[/red]"
+        rows = [
+            self._format_row(provider, status) for provider, status in self._health_status.items()
+        ]
+
+        table = _status_table()
+        for row in rows:
+            table.add_row(*row)
+
+        self.update(Group(table, _FOOTER))
+
+    @staticmethod
+    def _format_row(provider: str, status: dict) -> tuple[str, str, str, str]:
+        """Format one provider's status as a table row."""
+        if status.get("healthy"):
+            status_text = "[green]✓ Healthy[/green]"
+        elif status.get("error"):
+            status_text = "[red]✗ Error[/red]"
+        else:
+            status_text = "[yellow]⚠ Degraded[/yellow]"
+
+        # Format response time
+        response_time = status.get("response_time")
+        if response_time is not None:
+            time_text = f"{response_time:.2f}s"
+            # Color code by speed
+            if response_time < 2.0:
+                time_text = f"[green]{time_text}[/green]"
+            elif response_time < 5.0:
+                time_text = f"[yellow]{time_text}[/yellow]"
             else:
-                time_text = "[dim]--[/dim]"
-
-            # Get details
-            details = status.get("message") or status.get("error", "OK")
-            if len(details) > 40:
-                details = details[:37] + "..."
-
-            table.add_row(provider.capitalize(), status_text, time_text, details)
-
-        footer = Text("Auto-refreshes every 30s. Press 'r' to refresh manually.", style="dim")
-        self.update(Group(table, footer))
+                time_text = f"[red]{time_text}[/red]"
+        else:
+            time_text = "[dim]--[/dim]"
+
+        # Get details
+        details = status.get("message") or status.get("error", "OK")
+        if len(details) > 40:
+            details = details[:37] + "..."
+
+        return provider.capitalize(), status_text, time_text, details
+
+    @staticmethod
+    def _display_key(health_status: dict[str, dict]) -> tuple:
+        """Snapshot the status fields the table is rendered from."""
+        return tuple(
+            (
+                provider,
+                status.get("healthy"),
+                status.get("error"),
+                status.get("message"),
+                # Shown with two decimals; finer jitter doesn't change the table
+                (
+                    round(status["response_time"], 2)
+                    if status.get("response_time") is not None
+                    else None
+                ),
+            )
+            for provider, status in health_status.items()
+        )
 
     def action_refresh(self) -> None:
         """Manual refresh action."""
-        self.refresh_health()
+        self.refresh_health(force=True)
         self.notify("Refreshing provider health...", timeout=2)
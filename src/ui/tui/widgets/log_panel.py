@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import time
+from collections import deque
 from typing import TYPE_CHECKING
 
 from rich.table import Table
@@ -11,11 +15,33 @@ from textual.containers import VerticalScroll
 from textual.widgets import Static
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from textual.app import ComposeResult
 
     from ..state import AppState, LogEntry
 
 
+# Longest message shown before it is cut short with an ellipsis
+_MAX_MESSAGE_LENGTH = 200
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_message(message: str) -> str:
+    """Format log message.
+
+    Args:
+        message: Log message
+
+    Returns:
+        Formatted message
+    """
+    # Truncate very long messages
+    if len(message) > _MAX_MESSAGE_LENGTH:
+        return message[: _MAX_MESSAGE_LENGTH - 3] + "..."
+    return message
+
+
 class LogPanel(VerticalScroll):
     """Scrollable, filterable log viewer.
 
@@ -54,8 +80,14 @@ class LogPanel(VerticalScroll):
         "ERROR": "red",
     }
 
-    # Log level filtering order
-    LEVEL_ORDER = ["DEBUG", "INFO", "WARNING", "ERROR"]
+    # Log level filtering order, as integer ranks
+    LEVEL_RANK = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+
+    # Number of most recent (filtered) entries shown
+    MAX_VISIBLE_LOGS = 100
+
+    # Formatted timestamps kept before the cache is dropped and rebuilt
+    MAX_CACHED_TIMESTAMPS = 4096
 
     def __init__(self, **kwargs):
         """Initialize log panel."""
@@ -63,31 +95,71 @@ class LogPanel(VerticalScroll):
         self._filter_level = "DEBUG"  # Show all by default
         self._log_display = Static()
         self._auto_scroll = True
+        # Formatted rows currently shown, plus what they were built from, so
+        # updates only format entries appended since the last render
+        self._rows: deque[tuple[str | Text, ...]] = deque(maxlen=self.MAX_VISIBLE_LOGS)
+        self._last_entry: LogEntry | None = None
+        self._rendered_filter: str | None = None
+        # AppState.version seen by the last refresh
+        self._refreshed_version: int | None = None
+        # Level labels are shared by every row of that level
+        self._level_text_cache = {
+            level: Text(level.ljust(7), style=color) for level, color in self.LEVEL_COLORS.items()
+        }
+        # Whole second -> formatted time; bursts of logs share the same second
+        self._ts_cache: dict[int, str] = {}
 
     def compose(self) -> ComposeResult:
         """Compose log display."""
         yield self._log_display
 
-    def on_mount(self) -> None:
-        """Set up refresh timer on mount."""
-        self.set_interval(0.2, self._refresh_display)
-
     def _refresh_display(self) -> None:
-        """Refresh the display periodically."""
-        if hasattr(self.app, "state"):
-            self.update_logs(self.app.state)
+        """Re-render from the app state after a filter change.
+
+        New log entries are pushed in by the hosting screen through
+        ``update_logs``; this only re-reads the log when the app state or the
+        filter level changed since the previous refresh.
+        """
+        if not hasattr(self.app, "state"):
+            return
+        state = self.app.state
+        if state.version == self._refreshed_version and self._filter_level == self._rendered_filter:
+            return
+        self._refreshed_version = state.version
+        self.update_logs(state)
 
     def update_logs(self, state: AppState) -> None:
         """Update logs from app state.
 
+        Only entries appended since the previous call are filtered and
+        formatted; the display is rebuilt from scratch when the filter level
+        changes or the previously rendered entries are no longer in the log.
+
         Args:
             state: Current application state
         """
-        # Filter logs
-        filtered_logs = self._filter_logs(state.logs)
+        logs = state.logs
+        new_entries = self._new_entries(logs)
+        if new_entries is None:
+            self._rows.clear()
+            new_entries = logs
+        elif not new_entries:
+            return  # Nothing appended since the last render
+
+        self._rendered_filter = self._filter_level
+        self._last_entry = logs[-1] if logs else None
+
+        # Only the newest MAX_VISIBLE_LOGS matches can be shown, so scan from
+        # the end and stop once that many have been found
+        is_shown = self._level_filter()
+        newest_first = reversed(new_entries)
+        if is_shown is not None:
+            newest_first = filter(is_shown, newest_first)
+        visible = list(itertools.islice(newest_first, self.MAX_VISIBLE_LOGS))
+        self._rows.extend(self._format_row(entry) for entry in reversed(visible))
 
         # Build display
-        if not filtered_logs:
+        if not self._rows:
             self._log_display.update("[dim]No logs to display[/dim]")
             return
 
@@ -97,22 +169,10 @@ class LogPanel(VerticalScroll):
         table.add_column("level", width=8)
         table.add_column("message", no_wrap=False)
 
-        for entry in filtered_logs[-100:]:  # Show last 100 logs
-            # Handle truncation marker
-            if isinstance(entry, dict) and entry.get("truncated"):
-                count = entry.get("count", 0)
-                table.add_row(
-                    "[dim]--:--:--[/dim]",
-                    "[yellow]SKIP[/yellow]",
-                    f"[dim italic]... {count} entries truncated ...[/dim italic]",
-                )
-            # Handle normal log entries
-            elif hasattr(entry, "timestamp"):
-                table.add_row(
-                    self._format_timestamp(entry.timestamp),
-                    self._format_level(entry.level),
-                    self._format_message(entry.message),
-                )
+        # Rows are formatted tuples already; add them with one bound method
+        add_row = table.add_row
+        for row in self._rows:
+            add_row(*row)
 
         self._log_display.update(table)
 
@@ -120,43 +180,78 @@ class LogPanel(VerticalScroll):
         if self._auto_scroll:
             self.scroll_end(animate=False)
 
-    def _filter_logs(self, logs: list[LogEntry | dict]) -> list[LogEntry | dict]:
+    def _new_entries(self, logs: list[LogEntry]) -> list[LogEntry] | None:
+        """Return entries appended after the last rendered one.
+
+        Returns:
+            The new entries (possibly empty), or None if the display must be
+            rebuilt from the full log
+        """
+        if self._rendered_filter != self._filter_level:
+            return None
+
+        last = self._last_entry
+        if last is None:
+            return logs
+
+        # Appends and ring truncation both keep the newest entries at the end,
+        # so the last rendered entry is found within the first few steps back
+        for index in range(len(logs) - 1, -1, -1):
+            if logs[index] is last:
+                return logs[index + 1 :]
+        return None  # Log was reset
+
+    def _format_row(self, entry: LogEntry) -> tuple[str | Text, ...]:
+        """Format a log entry as a display table row."""
+        # Handle truncation marker
+        if entry.type == "truncated":
+            return (
+                "[dim]--:--:--[/dim]",
+                "[yellow]SKIP[/yellow]",
+                f"[dim italic]... {entry.message} ...[/dim italic]",
+            )
+        return (
+            self._format_timestamp(entry.timestamp),
+            self._format_level(entry.level),
+            _format_message(entry.message),
+        )
+
+    def _filter_logs(self, logs: list[LogEntry]) -> list[LogEntry]:
         """Filter logs based on current filter level.
 
         Args:
-            logs: All log entries (LogEntry objects or truncation marker dicts)
+            logs: All log entries (including truncation markers)
 
         Returns:
             Filtered log entries
         """
-        if self._filter_level == "DEBUG":
+        is_shown = self._level_filter()
+        if is_shown is None:
             return logs  # Show all
+        return [entry for entry in logs if is_shown(entry)]
 
-        # Get minimum level index
-        try:
-            min_index = self.LEVEL_ORDER.index(self._filter_level)
-        except ValueError:
-            return logs
+    def _level_filter(self) -> Callable[[LogEntry], bool] | None:
+        """Build the test for entries shown at the current filter level.
 
-        # Filter logs
-        filtered = []
-        for entry in logs:
-            # Handle truncation markers
-            if isinstance(entry, dict) and entry.get("truncated"):
-                filtered.append(entry)
-                continue
-
-            # Handle LogEntry objects
-            if hasattr(entry, "level"):
-                try:
-                    level_index = self.LEVEL_ORDER.index(entry.level)
-                    if level_index >= min_index:
-                        filtered.append(entry)
-                except ValueError:
-                    # Unknown level, include it
-                    filtered.append(entry)
-
-        return filtered
+        Returns:
+            Predicate for a single entry, or None if every entry is shown
+        """
+        if self._filter_level == "DEBUG":
+            return None
+
+        # Get minimum level rank
+        min_rank = self.LEVEL_RANK.get(self._filter_level)
+        if min_rank is None:
+            return None
+
+        # Unknown levels rank above ERROR so they are always included, as are
+        # truncation markers
+        rank_of = self.LEVEL_RANK.get
+        unknown_rank = len(self.LEVEL_RANK)
+        return (
+            lambda entry: entry.type == "truncated"
+            or rank_of(entry.level, unknown_rank) >= min_rank
+        )
 
     def _format_timestamp(self, timestamp: float) -> str:
         """Format timestamp for display.
@@ -167,10 +262,14 @@ class LogPanel(VerticalScroll):
         Returns:
             Formatted time string (HH:MM:SS)
         """
-        import time
-
-        local_time = time.localtime(timestamp)
-        return time.strftime("%H:%M:%S", local_time)
+        key = int(timestamp)
+        formatted = self._ts_cache.get(key)
+        if formatted is None:
+            formatted = time.strftime("%H:%M:%S", time.localtime(key))
+            if len(self._ts_cache) >= self.MAX_CACHED_TIMESTAMPS:
+                self._ts_cache.clear()
+            self._ts_cache[key] = formatted
+        return formatted
 
     def _format_level(self, level: str) -> Text:
         """Format log level with color.
@@ -181,47 +280,40 @@ class LogPanel(VerticalScroll):
         Returns:
             Colored text
         """
-        color = self.LEVEL_COLORS.get(level, "white")
-        return Text(level.ljust(7), style=color)
-
-    def _format_message(self, message: str) -> str:
-        """Format log message.
-
-        Args:
-            message: Log message
-
-        Returns:
-            Formatted message
-        """
-        # Truncate very long messages
-        max_length = 200
-        if len(message) > max_length:
-            return message[: max_length - 3] + "..."
-        return message
+        cached = self._level_text_cache.get(level)
+        if cached is not None:
+            return cached
+        return Text(level.ljust(7), style="white")
 
     # Action handlers for filtering
 
+    def _set_filter(self, level: str) -> None:
+        """Switch the filter level and re-render the log right away."""
+        self._filter_level = level
+        if self.is_mounted:
+            self._refresh_display()
+
     def action_filter_all(self) -> None:
         """Show all logs."""
-        self._filter_level = "DEBUG"
+        self._set_filter("DEBUG")
         self.notify("Showing all logs")
 
     def action_filter_debug(self) -> None:
         """Show debug+ logs."""
-        self._filter_level = "DEBUG"
+        self._set_filter("DEBUG")
         self.notify("Showing debug+ logs")
 
     def action_filter_info(self) -> None:
         """Show info+ logs."""
-        self._filter_level = "INFO"
+        self._set_filter("INFO")
         self.notify("Showing info+ logs")
 
     def action_filter_warning(self) -> None:
         """Show warning+ logs."""
-        self._filter_level = "WARNING"
+        self._set_filter("WARNING")
         self.notify("Showing warning+ logs")
 
     def action_filter_error(self) -> None:
         """Show error logs only."""
-        self._filter_level = "ERROR"
+        self._set_filter("ERROR")
         self.notify("Showing error logs only")
@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import time
-from collections import deque
 from typing import TYPE_CHECKING
 
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
 from textual.widgets import Static
 
 if TYPE_CHECKING:
-    from textual.app import ComposeResult
-
     from ..state import AppState
 
 
+# Weight of the newest rate sample in the ETA's exponential moving average
+_EMA_ALPHA = 0.2
+
+# Every progress bar a card can show, indexed by the number of filled cells
+_BAR_WIDTH = 30
+_BAR_TABLE = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+
 class ProgressBoard(Static):
     """Display progress cards for each pipeline stage.
 
@@ -26,9 +30,12 @@ class ProgressBoard(Static):
     - ETA calculation using exponential moving average
     - Status indicators (pending, running, complete, error)
 
+    The cards are pushed in by the hosting screen whenever the app state
+    changes; the board does not poll.
+
     Example:
         >>> board = ProgressBoard()
-        >>> board.update(app_state)
+        >>> board.update_display(app_state)
     """
 
     # Stage display names and order
@@ -51,24 +58,27 @@ class ProgressBoard(Static):
     def __init__(self, **kwargs):
         """Initialize progress board."""
         super().__init__(**kwargs)
-        self._eta_history: dict[str, deque[float]] = {}  # {stage: deque of rates}
-        self._last_update: dict[str, float] = {}  # {stage: timestamp}
-
-    def on_mount(self) -> None:
-        """Set up refresh timer on mount."""
-        self.set_interval(0.1, self._refresh_display)
-
-    def _refresh_display(self) -> None:
-        """Refresh the display periodically."""
-        if hasattr(self.app, "state"):
-            self.update_display(self.app.state)
+        self._ema_rate: dict[str, float] = {}  # {stage: smoothed units per second}
+        self._last_update: dict[str, float] = {}  # {stage: timestamp of last progress}
+        self._last_completed: dict[str, int] = {}  # {stage: completed units at last progress}
+        self._cached_eta: dict[str, str] = {}  # {stage: ETA string for last progress}
+        self._rendered_key: tuple | None = None  # State fields behind the current cards
+        self._cards: dict[str, tuple[tuple, Panel]] = {}  # {stage: (shown fields, card)}
 
     def update_display(self, state: AppState) -> None:
         """Update display from app state.
 
+        The cards are only rebuilt when a field they read has changed since
+        the last render.
+
         Args:
             state: Current application state
         """
+        key = self._display_key(state)
+        if key == self._rendered_key:
+            return
+        self._rendered_key = key
+
         table = Table.grid(padding=(1, 2))
         table.add_column(justify="center")
 
@@ -78,6 +88,18 @@ class ProgressBoard(Static):
 
         self.update(table)
 
+    @staticmethod
+    def _display_key(state: AppState) -> tuple:
+        """Snapshot the state fields the stage cards are rendered from."""
+        return (
+            state.current_stage,
+            state.current_message,
+            bool(state.errors),
+            tuple(state.stage_completed.items()),
+            tuple(state.stage_totals.items()),
+            tuple(state.stage_durations.items()),
+        )
+
     def _render_stage_card(self, state: AppState, stage_id: str, stage_name: str) -> Panel:
         """Render a progress card for a stage.
 
@@ -96,48 +118,55 @@ class ProgressBoard(Static):
         completed = state.stage_completed.get(stage_id, 0)
         total = state.stage_totals.get(stage_id, 100)
         percentage = (completed / total * 100) if total > 0 else 0
-
-        # Build progress bar
-        bar_width = 30
-        filled = int(percentage / 100 * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        filled = min(max(int(percentage / 100 * _BAR_WIDTH), 0), _BAR_WIDTH)
 
         # Get ETA
         eta_str = self._calculate_eta(state, stage_id, completed, total)
 
-        # Build content
-        content_lines = [
-            f"[bold]{bar}[/bold] {percentage:.0f}%",
-            "",
-        ]
+        # Current message if running
+        msg = ""
+        if status == "running" and state.current_stage == stage_id:
+            msg = state.current_message[:40]  # Truncate long messages
+
+        # Reuse the previous card while everything it shows is unchanged
+        duration = state.stage_durations.get(stage_id, 0) if status == "complete" else None
+        key = (
+            status,
+            filled,
+            round(percentage),
+            eta_str if status == "running" else None,
+            duration,
+            msg,
+        )
+        cached = self._cards.get(stage_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
+        # Build content
         if status == "running":
-            content_lines.append(f"[cyan]ETA: {eta_str}[/cyan]")
+            status_line = f"[cyan]ETA: {eta_str}[/cyan]"
         elif status == "complete":
-            duration = state.stage_durations.get(stage_id, 0)
-            content_lines.append(f"[green]✓ Completed in {duration:.1f}s[/green]")
+            status_line = f"[green]✓ Completed in {duration:.1f}s[/green]"
         elif status == "error":
-            content_lines.append("[red]✗ Error[/red]")
+            status_line = "[red]✗ Error[/red]"
         else:
-            content_lines.append("[dim]Waiting...[/dim]")
-
-        # Add current message if running
-        if status == "running" and state.current_stage == stage_id:
-            msg = state.current_message[:40]  # Truncate long messages
-            if msg:
-                content_lines.append(f"[dim]{msg}[/dim]")
+            status_line = "[dim]Waiting...[/dim]"
 
-        content = "\n".join(content_lines)
+        content = f"[bold]{_BAR_TABLE[filled]}[/bold] {percentage:.0f}%\n\n{status_line}"
+        if msg:
+            content += f"\n[dim]{msg}[/dim]"
 
         # Get border style based on status
         border_style = self.STATUS_COLORS.get(status, "white")
 
-        return Panel(
+        card = Panel(
             content,
             title=f"[bold]{stage_name}[/bold]",
             border_style=border_style,
             padding=(0, 1),
         )
+        self._cards[stage_id] = (key, card)
+        return card
 
     def _get_stage_status(self, state: AppState, stage_id: str) -> str:
         """Get stage status.
@@ -182,33 +211,43 @@ class ProgressBoard(Static):
         if completed == 0 or total == 0:
             return "--:--"
 
-        # Initialize history for this stage
-        if stage_id not in self._eta_history:
-            self._eta_history[stage_id] = deque(maxlen=10)
-            self._last_update[stage_id] = time.time()
+        # Nothing new to measure until the stage makes progress
+        last_completed = self._last_completed.get(stage_id)
+        if completed == last_completed and stage_id in self._cached_eta:
+            return self._cached_eta[stage_id]
 
-        # Calculate rate (units per second)
-        now = time.time()
-        if stage_id in self._last_update:
+        # Calculate rate (units per second) from the progress since the last sample
+        now = time.monotonic()
+        if last_completed is not None:
+            completed_delta = completed - last_completed
             time_delta = now - self._last_update[stage_id]
-            if time_delta > 0:
-                # Store rate in history
-                rate = 1.0 / time_delta  # Simple rate for now
-                self._eta_history[stage_id].append(rate)
+            if completed_delta > 0 and time_delta > 0:
+                rate = completed_delta / time_delta
+                previous = self._ema_rate.get(stage_id, rate)
+                self._ema_rate[stage_id] = _EMA_ALPHA * rate + (1 - _EMA_ALPHA) * previous
 
+        self._last_completed[stage_id] = completed
         self._last_update[stage_id] = now
 
-        # Calculate average rate
-        if not self._eta_history[stage_id]:
-            return "--:--"
+        eta = self._format_eta(self._ema_rate.get(stage_id, 0.0), total - completed)
+        self._cached_eta[stage_id] = eta
+        return eta
+
+    @staticmethod
+    def _format_eta(avg_rate: float, remaining_units: int) -> str:
+        """Format the time left for ``remaining_units`` at ``avg_rate``.
 
-        avg_rate = sum(self._eta_history[stage_id]) / len(self._eta_history[stage_id])
+        Args:
+            avg_rate: Smoothed rate (units per second)
+            remaining_units: Units still to complete
 
+        Returns:
+            ETA string (e.g., "00:15")
+        """
         if avg_rate == 0:
             return "--:--"
 
         # Calculate remaining time
-        remaining_units = total - completed
         remaining_seconds = remaining_units / avg_rate
 
         # Format as MM:SS
@@ -27,6 +27,14 @@ _ACTION_EXTRACT = "extract"
 _ACTION_TRANSCRIBE = "transcribe"
 _ACTION_EXPORT = "export-markdown"
 
+# Audio quality choices offered by the wizard, defaulting to speech
+_QUALITY_OPTIONS: tuple[str, ...] = tuple(q.value for q in AudioQuality)
+_DEFAULT_QUALITY_INDEX = (
+    _QUALITY_OPTIONS.index(AudioQuality.SPEECH.value)
+    if AudioQuality.SPEECH.value in _QUALITY_OPTIONS
+    else 0
+)
+
 
 @dataclass
 class WizardSelection:
@@ -36,6 +44,16 @@ class WizardSelection:
     summary: Sequence[tuple[str, str]]
 
 
+@dataclass(frozen=True, slots=True)
+class _MarkdownOpts:
+    """Markdown export answers shared by the process and transcribe flows."""
+
+    template: str = "default"
+    timestamps: bool = True
+    speakers: bool = True
+    confidence: bool = False
+
+
 def run_cli_wizard(console: ConsoleManager) -> WizardSelection | None:
     """Run the interactive wizard and produce a CLI argv for execution."""
 
@@ -53,6 +71,7 @@ def run_cli_wizard(console: ConsoleManager) -> WizardSelection | None:
         _ACTION_EXPORT: "Export Markdown from an existing transcript",
     }
 
+    action_keys = list(actions)
     labels = list(actions.values())
     selected_label = console.prompt_choice(
         "What would you like to do?",
@@ -60,8 +79,10 @@ def run_cli_wizard(console: ConsoleManager) -> WizardSelection | None:
         default_index=0,
     )
 
-    reverse_lookup = {label: key for key, label in actions.items()}
-    action = reverse_lookup.get(selected_label, _ACTION_PROCESS)
+    try:
+        action = action_keys[labels.index(selected_label)]
+    except ValueError:
+        action = _ACTION_PROCESS
 
     if action == _ACTION_PROCESS:
         selection = _collect_process_flow(console)
@@ -97,16 +118,10 @@ def _collect_process_flow(console: ConsoleManager) -> WizardSelection | None:
 
     output_dir = console.prompt_text("Where should results be saved?", default="output")
 
-    quality_options = [q.value for q in AudioQuality]
-    try:
-        default_quality_index = quality_options.index(AudioQuality.SPEECH.value)
-    except ValueError:  # pragma: no cover - defensive
-        default_quality_index = 0
-
     quality_choice = console.prompt_choice(
         "Choose audio quality",
-        quality_options,
-        default_index=default_quality_index,
+        _QUALITY_OPTIONS,
+        default_index=_DEFAULT_QUALITY_INDEX,
     )
 
     provider_choice = console.prompt_choice(
@@ -128,59 +143,27 @@ def _collect_process_flow(console: ConsoleManager) -> WizardSelection | None:
         default=True,
     )
 
-    md_template = "default"
-    md_include_timestamps = True
-    md_include_speakers = True
-    md_include_confidence = False
-    if export_markdown:
-        md_template = console.prompt_choice(
-            "Markdown template",
-            ["default", "minimal", "detailed"],
-            default_index=0,
-        )
-        md_include_timestamps = console.prompt_confirmation(
-            "Include timestamps?",
-            default=True,
-        )
-        md_include_speakers = console.prompt_confirmation(
-            "Include speaker labels?",
-            default=True,
-        )
-        md_include_confidence = console.prompt_confirmation(
-            "Include confidence scores?",
-            default=False,
-        )
+    markdown = _prompt_markdown_options(console) if export_markdown else _MarkdownOpts()
 
     generate_html = console.prompt_confirmation(
         "Generate an HTML dashboard summary?",
         default=True,
     )
 
-    argv: list[str] = [
-        _ACTION_PROCESS,
-        str(video_file),
-    ]
-
-    if output_dir:
-        argv += ["--output-dir", output_dir]
-    if quality_choice:
-        argv += ["--quality", quality_choice]
-    if provider_choice:
-        argv += ["--provider", provider_choice]
-    if language_code:
-        argv += ["--language", language_code]
-    if analysis_style:
-        argv += ["--analysis-style", analysis_style]
+    argv: list[str] = [_ACTION_PROCESS, str(video_file)]
+    argv.extend(
+        _option_args(
+            {
+                "--output-dir": output_dir,
+                "--quality": quality_choice,
+                "--provider": provider_choice,
+                "--language": language_code,
+                "--analysis-style": analysis_style,
+            }
+        )
+    )
     if export_markdown:
-        argv.append("--export-markdown")
-        if md_template:
-            argv += ["--md-template", md_template]
-        if not md_include_timestamps:
-            argv.append("--md-no-timestamps")
-        if not md_include_speakers:
-            argv.append("--md-no-speakers")
-        if md_include_confidence:
-            argv.append("--md-confidence")
+        argv.extend(_markdown_args(markdown))
     if generate_html:
         argv.append("--html-dashboard")
 
@@ -197,14 +180,7 @@ def _collect_process_flow(console: ConsoleManager) -> WizardSelection | None:
     ]
 
     if export_markdown:
-        summary.extend(
-            [
-                ("Markdown template", md_template),
-                ("MD timestamps", "yes" if md_include_timestamps else "no"),
-                ("MD speakers", "yes" if md_include_speakers else "no"),
-                ("MD confidence", "yes" if md_include_confidence else "no"),
-            ]
-        )
+        summary.extend(_markdown_summary(markdown))
 
     return WizardSelection(argv=argv, summary=summary)
 
@@ -219,23 +195,14 @@ def _collect_extract_flow(console: ConsoleManager) -> WizardSelection | None:
         default=f"{video_file.stem}.mp3",
     )
 
-    quality_options = [q.value for q in AudioQuality]
-    try:
-        default_quality_index = quality_options.index(AudioQuality.SPEECH.value)
-    except ValueError:  # pragma: no cover
-        default_quality_index = 0
-
     quality_choice = console.prompt_choice(
         "Choose audio quality",
-        quality_options,
-        default_index=default_quality_index,
+        _QUALITY_OPTIONS,
+        default_index=_DEFAULT_QUALITY_INDEX,
     )
 
     argv: list[str] = [_ACTION_EXTRACT, str(video_file)]
-    if output_path:
-        argv += ["--output", output_path]
-    if quality_choice:
-        argv += ["--quality", quality_choice]
+    argv.extend(_option_args({"--output": output_path, "--quality": quality_choice}))
 
     summary = [
         ("Operation", "Extract audio"),
@@ -269,47 +236,20 @@ def _collect_transcribe_flow(console: ConsoleManager) -> WizardSelection | None:
         default=True,
     )
 
-    md_template = "default"
-    md_include_timestamps = True
-    md_include_speakers = True
-    md_include_confidence = False
-
-    if export_markdown:
-        md_template = console.prompt_choice(
-            "Markdown template",
-            ["default", "minimal", "detailed"],
-            default_index=0,
-        )
-        md_include_timestamps = console.prompt_confirmation(
-            "Include timestamps?",
-            default=True,
-        )
-        md_include_speakers = console.prompt_confirmation(
-            "Include speaker labels?",
-            default=True,
-        )
-        md_include_confidence = console.prompt_confirmation(
-            "Include confidence scores?",
-            default=False,
-        )
+    markdown = _prompt_markdown_options(console) if export_markdown else _MarkdownOpts()
 
     argv: list[str] = [_ACTION_TRANSCRIBE, str(audio_file)]
-    if output_path:
-        argv += ["--output", output_path]
-    if provider_choice:
-        argv += ["--provider", provider_choice]
-    if language_code:
-        argv += ["--language", language_code]
+    argv.extend(
+        _option_args(
+            {
+                "--output": output_path,
+                "--provider": provider_choice,
+                "--language": language_code,
+            }
+        )
+    )
     if export_markdown:
-        argv.append("--export-markdown")
-        if md_template:
-            argv += ["--md-template", md_template]
-        if not md_include_timestamps:
-            argv.append("--md-no-timestamps")
-        if not md_include_speakers:
-            argv.append("--md-no-speakers")
-        if md_include_confidence:
-            argv.append("--md-confidence")
+        argv.extend(_markdown_args(markdown))
 
     summary = [
         ("Operation", "Transcribe audio"),
@@ -321,14 +261,7 @@ def _collect_transcribe_flow(console: ConsoleManager) -> WizardSelection | None:
     ]
 
     if export_markdown:
-        summary.extend(
-            [
-                ("Markdown template", md_template),
-                ("MD timestamps", "yes" if md_include_timestamps else "no"),
-                ("MD speakers", "yes" if md_include_speakers else "no"),
-                ("MD confidence", "yes" if md_include_confidence else "no"),
-            ]
-        )
+        summary.extend(_markdown_summary(markdown))
 
     return WizardSelection(argv=argv, summary=summary)
 
@@ -443,6 +376,68 @@ def _prompt_path(
         return candidate
 
 
+def _prompt_markdown_options(console: ConsoleManager) -> _MarkdownOpts:
+    """Ask how the Markdown transcript should be formatted."""
+
+    template = console.prompt_choice(
+        "Markdown template",
+        ["default", "minimal", "detailed"],
+        default_index=0,
+    )
+    timestamps = console.prompt_confirmation(
+        "Include timestamps?",
+        default=True,
+    )
+    speakers = console.prompt_confirmation(
+        "Include speaker labels?",
+        default=True,
+    )
+    confidence = console.prompt_confirmation(
+        "Include confidence scores?",
+        default=False,
+    )
+    return _MarkdownOpts(template, timestamps, speakers, confidence)
+
+
+def _markdown_args(markdown: _MarkdownOpts) -> list[str]:
+    """Translate Markdown answers into ``--export-markdown`` and its options."""
+
+    return [
+        "--export-markdown",
+        *_option_args({"--md-template": markdown.template}),
+        *_flag_args(
+            {
+                "--md-no-timestamps": not markdown.timestamps,
+                "--md-no-speakers": not markdown.speakers,
+                "--md-confidence": markdown.confidence,
+            }
+        ),
+    ]
+
+
+def _markdown_summary(markdown: _MarkdownOpts) -> list[tuple[str, str]]:
+    """Summarize Markdown answers for the confirmation panel."""
+
+    return [
+        ("Markdown template", markdown.template),
+        ("MD timestamps", "yes" if markdown.timestamps else "no"),
+        ("MD speakers", "yes" if markdown.speakers else "no"),
+        ("MD confidence", "yes" if markdown.confidence else "no"),
+    ]
+
+
+def _option_args(options: dict[str, str]) -> list[str]:
+    """Flatten ``{flag: value}`` into argv, skipping options left empty."""
+
+    return [arg for flag, value in options.items() if value for arg in (flag, value)]
+
+
+def _flag_args(flags: dict[str, bool]) -> list[str]:
+    """Return the flags whose condition holds, in order."""
+
+    return [flag for flag, enabled in flags.items() if enabled]
+
+
 def _render_summary(console: ConsoleManager, summary: Sequence[tuple[str, str]]) -> None:
     if console.json_output:
         return
@@ -1,28 +1,41 @@
-"""Utility modules for audio extraction and analysis."""
+"""Utility modules for audio extraction and analysis.
 
-from .retry import (
-    # Configuration constants
-    DEFAULT_MAX_NETWORK_ATTEMPTS,
-    DEFAULT_MAX_RATE_LIMIT_ATTEMPTS,
-    FFMPEG_MAX_ATTEMPTS,
-    PERMANENT_EXCEPTIONS,
-    PROVIDER_MAX_ATTEMPTS,
-    # Legacy utilities (for backward compatibility)
-    RetryConfig,
-    RetryExhaustedError,
-    calculate_delay,
-    create_custom_retry,
-    is_retriable_exception,
-    log_retry_attempt,
-    retry_async,
-    retry_ffmpeg_operation,
-    # New tenacity-based decorators (recommended for new code)
-    retry_on_network_error,
-    retry_on_network_error_async,
-    retry_on_rate_limit,
-    retry_on_transient_error,
-    retry_sync,
-)
+The retry helpers listed in ``__all__`` are re-exported from
+:mod:`src.utils.retry`, which is only imported (together with tenacity) the
+first time one of them is accessed. Importing a sibling module such as
+``src.utils.ffmpeg_utils`` therefore does not pay for the retry stack.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import retry
+    from .retry import (
+        # Configuration constants
+        DEFAULT_MAX_NETWORK_ATTEMPTS,
+        DEFAULT_MAX_RATE_LIMIT_ATTEMPTS,
+        FFMPEG_MAX_ATTEMPTS,
+        PERMANENT_EXCEPTIONS,
+        PROVIDER_MAX_ATTEMPTS,
+        # Legacy utilities (for backward compatibility)
+        RetryConfig,
+        RetryExhaustedError,
+        calculate_delay,
+        create_custom_retry,
+        is_retriable_exception,
+        log_retry_attempt,
+        retry_async,
+        retry_ffmpeg_operation,
+        # New tenacity-based decorators (recommended for new code)
+        retry_on_network_error,
+        retry_on_network_error_async,
+        retry_on_rate_limit,
+        retry_on_transient_error,
+        retry_sync,
+    )
 
 __all__ = [
     # Configuration constants
@@ -47,3 +60,22 @@ __all__ = [
     "retry_on_transient_error",
     "retry_sync",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import :mod:`.retry` on first access to one of its re-exported names."""
+    if name != "retry" and name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    retry_module = importlib.import_module(".retry", __name__)
+    if name == "retry":
+        return retry_module
+
+    value = getattr(retry_module, name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy re-exports alongside the names already loaded."""
+    return sorted({*globals(), *__all__})
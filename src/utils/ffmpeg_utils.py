@@ -2,23 +2,139 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import os
 import subprocess
 from collections.abc import Coroutine
-from functools import wraps
-from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
 T = TypeVar("T")
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# Exceptions the decorators turn into a None result
+_FFMPEG_EXCEPTIONS = (
+    subprocess.CalledProcessError,
+    subprocess.TimeoutExpired,
+    FileNotFoundError,
+    PermissionError,
+    OSError,
+    ValueError,
+)
+
+# Log message per handled exception type other than CalledProcessError,
+# formatted with the operation name and the error
+_FFMPEG_ERROR_MESSAGES: dict[type[BaseException], str] = {
+    subprocess.TimeoutExpired: "%s timed out: %s",
+    FileNotFoundError: "Required file not found during %s: %s",
+    PermissionError: "Permission denied during %s: %s",
+    OSError: "System error during %s: %s",
+    ValueError: "Invalid input for %s: %s",
+}
+
+
+def _log_ffmpeg_error(operation_name: str, error: BaseException) -> None:
+    """Log a handled FFmpeg error with the message for its exception type.
+
+    Failed commands log their stderr. Subclasses (e.g. ``IsADirectoryError``)
+    use the message of their nearest handled base class.
+    """
+    if isinstance(error, subprocess.CalledProcessError):
+        logger.error("%s failed: %s", operation_name, getattr(error, "stderr", error))
+        return
+
+    message = _FFMPEG_ERROR_MESSAGES.get(type(error))
+    if message is None:
+        message = next(
+            _FFMPEG_ERROR_MESSAGES[cls]
+            for cls in type(error).__mro__
+            if cls in _FFMPEG_ERROR_MESSAGES
+        )
+    logger.error(message, operation_name, error)
+
+
+def _retry_on_timeout(func: F) -> F:
+    """Retry ``func`` with exponential backoff while it raises ``TimeoutExpired``.
+
+    Uses the FFmpeg retry budget from :mod:`.retry_tenacity`, imported here so
+    that plain (non-retrying) decorators never load tenacity. Once the attempts
+    run out, the last ``TimeoutExpired`` is re-raised to the error handler.
+    """
+    from .retry_tenacity import FFMPEG_MAX_ATTEMPTS, FFMPEG_WAIT, create_custom_retry
+
+    retrying = create_custom_retry(
+        (subprocess.TimeoutExpired,),
+        max_attempts=FFMPEG_MAX_ATTEMPTS,
+        initial_wait=FFMPEG_WAIT,
+    )
+    return cast("F", retrying(func))
+
+
+@lru_cache(maxsize=64)
+def _error_handler(
+    operation_name: str, retry_timeouts: bool = False
+) -> Callable[[Callable[P, T]], Callable[P, T | None]]:
+    """Build the decorator behind ``handle_ffmpeg_errors(operation_name)``.
+
+    Cached per operation name and retry setting, so every function decorated
+    with the same arguments shares one decorator; each decorated function
+    still gets its own wrapper.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T | None]:
+        call = _retry_on_timeout(func) if retry_timeouts else func
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
+            try:
+                return call(*args, **kwargs)
+            except _FFMPEG_EXCEPTIONS as e:
+                _log_ffmpeg_error(operation_name, e)
+                return None
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=64)
+def _async_error_handler(
+    operation_name: str, retry_timeouts: bool = False
+) -> Callable[
+    [Callable[P, Coroutine[object, object, T]]], Callable[P, Coroutine[object, object, T | None]]
+]:
+    """Build the decorator behind ``handle_ffmpeg_errors_async(operation_name)``."""
+
+    def decorator(
+        func: Callable[P, Coroutine[object, object, T]],
+    ) -> Callable[P, Coroutine[object, object, T | None]]:
+        call = _retry_on_timeout(func) if retry_timeouts else func
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
+            try:
+                return await call(*args, **kwargs)
+            except _FFMPEG_EXCEPTIONS as e:
+                _log_ffmpeg_error(operation_name, e)
+                return None
+
+        return wrapper
+
+    return decorator
 
 
 def handle_ffmpeg_errors(
     operation_name: str = "FFmpeg operation",
+    *,
+    retry_timeouts: bool = False,
 ) -> Callable[[Callable[P, T]], Callable[P, T | None]]:
     """Decorator to handle common FFmpeg errors consistently.
 
@@ -30,6 +146,9 @@ def handle_ffmpeg_errors(
 
     Args:
         operation_name: Description of the operation for error messages (default: "FFmpeg operation")
+        retry_timeouts: Retry the call with exponential backoff when it raises
+            ``subprocess.TimeoutExpired``, returning None only once the FFmpeg
+            retry attempts are used up (default: False)
 
     Returns:
         Decorator that wraps functions to return `T | None` instead of `T`.
@@ -59,37 +178,13 @@ def handle_ffmpeg_errors(
         to returning None. Ensure all callers are updated to handle None returns.
     """
 
-    def decorator(func: Callable[P, T]) -> Callable[P, T | None]:
-        @wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
-            try:
-                return func(*args, **kwargs)
-            except subprocess.CalledProcessError as e:
-                logger.error(f"{operation_name} failed: {getattr(e, 'stderr', str(e))}")
-                return None
-            except subprocess.TimeoutExpired as e:
-                logger.error(f"{operation_name} timed out: {e}")
-                return None
-            except FileNotFoundError as e:
-                logger.error(f"Required file not found during {operation_name}: {e}")
-                return None
-            except PermissionError as e:
-                logger.error(f"Permission denied during {operation_name}: {e}")
-                return None
-            except OSError as e:
-                logger.error(f"System error during {operation_name}: {e}")
-                return None
-            except ValueError as e:
-                logger.error(f"Invalid input for {operation_name}: {e}")
-                return None
-
-        return wrapper
-
-    return decorator
+    return _error_handler(operation_name, retry_timeouts)
 
 
 def handle_ffmpeg_errors_async(
     operation_name: str = "FFmpeg operation",
+    *,
+    retry_timeouts: bool = False,
 ) -> Callable[
     [Callable[P, Coroutine[object, object, T]]], Callable[P, Coroutine[object, object, T | None]]
 ]:
@@ -104,6 +199,9 @@ def handle_ffmpeg_errors_async(
 
     Args:
         operation_name: Description of the operation for error messages (default: "FFmpeg operation")
+        retry_timeouts: Retry the call with exponential backoff when it raises
+            ``subprocess.TimeoutExpired``, returning None only once the FFmpeg
+            retry attempts are used up (default: False)
 
     Returns:
         Decorator that wraps async functions to return `T | None` instead of `T`.
@@ -135,32 +233,73 @@ def handle_ffmpeg_errors_async(
         tasks may go unnoticed without proper None-checking.
     """
 
-    def decorator(
-        func: Callable[P, Coroutine[object, object, T]],
-    ) -> Callable[P, Coroutine[object, object, T | None]]:
-        @wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T | None:
-            try:
-                return await func(*args, **kwargs)
-            except subprocess.CalledProcessError as e:
-                logger.error(f"{operation_name} failed: {getattr(e, 'stderr', str(e))}")
-                return None
-            except subprocess.TimeoutExpired as e:
-                logger.error(f"{operation_name} timed out: {e}")
-                return None
-            except FileNotFoundError as e:
-                logger.error(f"Required file not found during {operation_name}: {e}")
-                return None
-            except PermissionError as e:
-                logger.error(f"Permission denied during {operation_name}: {e}")
-                return None
-            except OSError as e:
-                logger.error(f"System error during {operation_name}: {e}")
-                return None
-            except ValueError as e:
-                logger.error(f"Invalid input for {operation_name}: {e}")
-                return None
+    return _async_error_handler(operation_name, retry_timeouts)
 
-        return wrapper
 
-    return decorator
+async def run_ffmpeg_batch(
+    commands: Sequence[Sequence[str]],
+    operation_name: str = "FFmpeg operation",
+    *,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+) -> list[bytes | None]:
+    """Run FFmpeg/ffprobe commands concurrently and collect their output.
+
+    Each command runs as its own subprocess, with at most ``concurrency``
+    running at once. A command that fails (non-zero exit, missing binary,
+    timeout, ...) is logged exactly as ``handle_ffmpeg_errors_async`` would
+    and yields None in its slot without affecting the others. A subprocess
+    still running when its command times out or the batch is cancelled is
+    killed and reaped.
+
+    Args:
+        commands: Argument vectors, e.g. one ``ffprobe`` call per file
+        operation_name: Description of the operation for error messages (default: "FFmpeg operation")
+        concurrency: Most subprocesses running at once (default: CPU count)
+        timeout: Seconds each command may run before it is killed and counts
+            as timed out (default: no limit)
+
+    Returns:
+        The stdout of each command, in the order given, or None where it failed
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1
+
+    Example:
+        >>> outputs = await run_ffmpeg_batch(
+        ...     [["ffprobe", "-v", "quiet", "-show_format", str(path)] for path in videos],
+        ...     "ffprobe metadata",
+        ... )
+        >>> failed = [path for path, out in zip(videos, outputs) if out is None]
+    """
+    limit = (os.cpu_count() or 1) if concurrency is None else concurrency
+    if limit < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    slots = asyncio.Semaphore(limit)
+
+    @handle_ffmpeg_errors_async(operation_name)
+    async def run(command: Sequence[str]) -> bytes:
+        async with slots:
+            proc = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except TimeoutError:
+                raise subprocess.TimeoutExpired(list(command), timeout) from None
+            finally:
+                # Timed out or cancelled: don't leave the subprocess running
+                if proc.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        proc.kill()
+                    await proc.wait()
+        if proc.returncode:
+            raise subprocess.CalledProcessError(
+                proc.returncode,
+                list(command),
+                output=stdout,
+                stderr=stderr.decode(errors="replace"),
+            )
+        return stdout
+
+    return await asyncio.gather(*(run(command) for command in commands))
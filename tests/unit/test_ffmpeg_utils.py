@@ -7,15 +7,23 @@ Tests cover:
 - Custom operation names in error messages
 - Function metadata preservation
 - Return value handling (None on error, actual value on success)
+- Opt-in retry of timeouts
 """
 
+import asyncio
 import logging
+import os
 import subprocess
+import sys
 from typing import Optional
 
 import pytest
 
-from src.utils.ffmpeg_utils import handle_ffmpeg_errors, handle_ffmpeg_errors_async
+from src.utils.ffmpeg_utils import (
+    handle_ffmpeg_errors,
+    handle_ffmpeg_errors_async,
+    run_ffmpeg_batch,
+)
 
 
 class TestHandleFfmpegErrorsDecorator:
@@ -229,6 +237,32 @@ class TestHandleFfmpegErrorsDecorator:
             assert "Logging test" in caplog.text
             assert "Test file missing" in caplog.text
 
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (
+                subprocess.CalledProcessError(1, ["ffmpeg"], stderr="bad codec"),
+                "Probe failed: bad codec",
+            ),
+            (subprocess.TimeoutExpired(["ffmpeg"], 5), "Probe timed out: "),
+            (FileNotFoundError("x.mp4"), "Required file not found during Probe: x.mp4"),
+            (PermissionError("x.mp4"), "Permission denied during Probe: x.mp4"),
+            (IsADirectoryError("x.mp4"), "System error during Probe: x.mp4"),
+            (ValueError("bad rate"), "Invalid input for Probe: bad rate"),
+        ],
+    )
+    def test_logs_message_for_error_type(self, caplog, error, expected):
+        """Test each handled error type, and subclasses, log their own message."""
+
+        @handle_ffmpeg_errors("Probe")
+        def failing_func() -> str | None:
+            raise error
+
+        with caplog.at_level(logging.ERROR):
+            assert failing_func() is None
+
+        assert caplog.records[-1].getMessage().startswith(expected)
+
 
 class TestHandleFfmpegErrorsAsyncDecorator:
     """Tests for handle_ffmpeg_errors_async - asynchronous error handling decorator."""
@@ -461,3 +495,165 @@ class TestDecoratorComparison:
 
         assert async_func.__name__ == "async_func"
         assert async_func.__doc__ == "Async docstring."
+
+    def test_decorators_are_shared_per_operation_name(self):
+        """Test repeated factory calls reuse one decorator but wrap each function."""
+        assert handle_ffmpeg_errors("Shared") is handle_ffmpeg_errors("Shared")
+        assert handle_ffmpeg_errors_async("Shared") is handle_ffmpeg_errors_async("Shared")
+        assert handle_ffmpeg_errors("Shared") is not handle_ffmpeg_errors("Other")
+
+        def first() -> str:
+            return "first"
+
+        def second() -> str:
+            return "second"
+
+        decorator = handle_ffmpeg_errors("Shared")
+        wrapped_first, wrapped_second = decorator(first), decorator(second)
+
+        assert wrapped_first.__wrapped__ is first
+        assert wrapped_second.__wrapped__ is second
+        assert (wrapped_first(), wrapped_second()) == ("first", "second")
+
+
+class TestRetryTimeouts:
+    """Tests for the retry_timeouts option of both decorators."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Skip the real backoff sleeps between attempts."""
+
+        async def no_sleep(_seconds):
+            return None
+
+        monkeypatch.setattr("time.sleep", lambda _seconds: None)
+        monkeypatch.setattr("asyncio.sleep", no_sleep)
+
+    def test_transient_timeout_is_retried(self):
+        """Test a call that times out once succeeds on the next attempt."""
+        calls = []
+
+        @handle_ffmpeg_errors("Retry test", retry_timeouts=True)
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise subprocess.TimeoutExpired(["ffmpeg"], 60)
+            return "done"
+
+        assert flaky() == "done"
+        assert len(calls) == 2
+
+    def test_persistent_timeout_returns_none(self, caplog):
+        """Test the last timeout is logged and None returned once attempts run out."""
+        from src.utils.retry_tenacity import FFMPEG_MAX_ATTEMPTS
+
+        calls = []
+
+        @handle_ffmpeg_errors("Retry test", retry_timeouts=True)
+        def hung() -> str:
+            calls.append(1)
+            raise subprocess.TimeoutExpired(["ffmpeg"], 60)
+
+        with caplog.at_level(logging.ERROR):
+            assert hung() is None
+
+        assert len(calls) == FFMPEG_MAX_ATTEMPTS
+        assert "Retry test timed out" in caplog.text
+
+    def test_other_errors_are_not_retried(self):
+        """Test only timeouts are retried; other handled errors return None at once."""
+        calls = []
+
+        @handle_ffmpeg_errors("Retry test", retry_timeouts=True)
+        def failing() -> str:
+            calls.append(1)
+            raise subprocess.CalledProcessError(1, ["ffmpeg"], stderr="bad input")
+
+        assert failing() is None
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_transient_timeout_is_retried(self):
+        """Test the async decorator retries a timed-out coroutine."""
+        calls = []
+
+        @handle_ffmpeg_errors_async("Async retry test", retry_timeouts=True)
+        async def flaky() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                raise subprocess.TimeoutExpired(["ffmpeg"], 60)
+            return "done"
+
+        assert await flaky() == "done"
+        assert len(calls) == 2
+
+
+class TestRunFfmpegBatch:
+    """Tests for run_ffmpeg_batch - concurrent subprocess runner."""
+
+    @pytest.mark.asyncio
+    async def test_collects_output_in_order_and_none_for_failures(self, caplog):
+        """Test each command's stdout is returned in order, failures as None."""
+        commands = [
+            [sys.executable, "-c", "print('first')"],
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"],
+            ["definitely-not-an-ffmpeg-binary"],
+            [sys.executable, "-c", "print('last')"],
+        ]
+
+        with caplog.at_level(logging.ERROR):
+            outputs = await run_ffmpeg_batch(commands, "Batch probe", concurrency=2)
+
+        assert [out.strip() if out else out for out in outputs] == [
+            b"first",
+            None,
+            None,
+            b"last",
+        ]
+        assert "Batch probe failed: boom" in caplog.text
+        assert "Required file not found during Batch probe" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_positive_concurrency(self):
+        """Test a concurrency below 1 is refused instead of deadlocking."""
+        with pytest.raises(ValueError, match="concurrency"):
+            await run_ffmpeg_batch([[sys.executable, "-c", "pass"]], concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_timed_out_command_is_killed(self, caplog):
+        """Test a command past its timeout is killed, logged and yields None."""
+        commands = [
+            [sys.executable, "-c", "import time; time.sleep(30)"],
+            [sys.executable, "-c", "print('quick')"],
+        ]
+
+        with caplog.at_level(logging.ERROR):
+            outputs = await asyncio.wait_for(
+                run_ffmpeg_batch(commands, "Batch probe", timeout=0.5), timeout=10
+            )
+
+        assert outputs[0] is None
+        assert outputs[1].strip() == b"quick"
+        assert "Batch probe timed out" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_kills_running_commands(self, tmp_path):
+        """Test cancelling the batch does not leave its subprocesses running."""
+        pid_file = tmp_path / "pid"
+        script = (
+            "import os, pathlib, time; "
+            f"pathlib.Path({str(pid_file)!r}).write_text(str(os.getpid())); "
+            "time.sleep(30)"
+        )
+        batch = asyncio.create_task(run_ffmpeg_batch([[sys.executable, "-c", script]]))
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text():
+                break
+            await asyncio.sleep(0.05)
+
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
@@ -36,13 +36,20 @@ def config_screen(monkeypatch) -> ConfigScreen:
     )
     screen = ConfigScreen()
     screen.app = DummyApp()  # type: ignore[assignment]
+    # Unmounted screens have no running timer loop; capture debounce scheduling instead
+    screen.set_timer = MagicMock()  # type: ignore[method-assign]
     return screen
 
 
-def test_on_input_changed_updates_state(config_screen: ConfigScreen) -> None:
+@patch("src.ui.tui.views.config.save_settings", return_value=True)
+def test_on_input_changed_updates_state(_mock_save, config_screen: ConfigScreen) -> None:
     event = SimpleNamespace(input=SimpleNamespace(id="output-dir-input"), value="/data/out")
     config_screen.on_input_changed(event)
+    assert config_screen.settings["last_output_dir"] == "/data/out"
+
+    config_screen.action_start_run()
     assert config_screen.app.state.output_dir == Path("/data/out")
+    assert config_screen.app.state.pending_run_config["output_dir"] == str(Path("/data/out"))
 
 
 def test_on_select_changed_updates_defaults(config_screen: ConfigScreen) -> None:
@@ -52,6 +59,66 @@ def test_on_select_changed_updates_defaults(config_screen: ConfigScreen) -> None
     assert config_screen.app.state.analysis_style == "full"
 
 
+def test_unchanged_values_do_not_schedule_save(config_screen: ConfigScreen) -> None:
+    current = config_screen.settings["defaults"]["quality"]
+    config_screen.on_select_changed(
+        SimpleNamespace(select=SimpleNamespace(id="quality-select"), value=current)
+    )
+    config_screen.on_input_changed(
+        SimpleNamespace(
+            input=SimpleNamespace(id="output-dir-input"),
+            value=config_screen.settings["last_output_dir"],
+        )
+    )
+
+    config_screen.set_timer.assert_not_called()
+    assert config_screen._settings_dirty is False
+    assert config_screen.app.state.quality == current
+
+
+def test_on_select_changed_ignores_unknown_select(config_screen: ConfigScreen) -> None:
+    before = dict(config_screen.settings["defaults"])
+    event = SimpleNamespace(select=SimpleNamespace(id="theme-select"), value="x")
+    config_screen.on_select_changed(event)
+
+    assert config_screen.settings["defaults"] == before
+    config_screen.set_timer.assert_not_called()
+
+
+@patch("src.ui.tui.views.config.save_settings", return_value=True)
+def test_auto_save_is_debounced(mock_save, config_screen: ConfigScreen) -> None:
+    first_timer = MagicMock()
+    config_screen.set_timer.side_effect = [first_timer, MagicMock()]
+
+    event = SimpleNamespace(input=SimpleNamespace(id="output-dir-input"), value="/data/out")
+    config_screen.on_input_changed(event)
+    event = SimpleNamespace(select=SimpleNamespace(id="quality-select"), value="high")
+    config_screen.on_select_changed(event)
+
+    mock_save.assert_not_called()
+    first_timer.stop.assert_called_once()
+    assert config_screen.set_timer.call_count == 2
+
+    # Fire the pending timer callback: a single write with the latest settings
+    _delay, callback = config_screen.set_timer.call_args.args
+    callback()
+    mock_save.assert_called_once_with(config_screen.settings)
+    assert config_screen.settings["defaults"]["quality"] == "high"
+
+
+@patch("src.ui.tui.views.config.save_settings", return_value=True)
+def test_pending_changes_flush_when_leaving(mock_save, config_screen: ConfigScreen) -> None:
+    config_screen.on_screen_suspend()
+    mock_save.assert_not_called()  # Nothing pending
+
+    event = SimpleNamespace(select=SimpleNamespace(id="language-select"), value="fr")
+    config_screen.on_select_changed(event)
+    config_screen.on_screen_suspend()
+    config_screen.on_unmount()
+
+    mock_save.assert_called_once_with(config_screen.settings)
+
+
 def test_action_start_run_missing_input(config_screen: ConfigScreen) -> None:
     config_screen.app.state.input_path = None
     config_screen.notify = MagicMock()
@@ -62,13 +129,38 @@ def test_action_start_run_missing_input(config_screen: ConfigScreen) -> None:
 @patch("src.ui.tui.views.config.save_settings", return_value=True)
 def test_action_start_run_success(mock_save, config_screen: ConfigScreen) -> None:  # type: ignore[override]
     config_screen.notify = MagicMock()
+    event = SimpleNamespace(select=SimpleNamespace(id="quality-select"), value="high")
+    config_screen.on_select_changed(event)
+
     config_screen.action_start_run()
 
-    mock_save.assert_called()
+    mock_save.assert_called_once_with(config_screen.settings)
     assert config_screen.app.state.pending_run_config is not None
     config_screen.app.push_screen.assert_called_with("run")
 
 
+@patch("src.ui.tui.views.config.save_settings", return_value=True)
+def test_action_start_run_skips_save_when_clean(mock_save, config_screen: ConfigScreen) -> None:
+    config_screen.action_start_run()
+    mock_save.assert_not_called()
+
+    # Changing a value and then changing it back leaves nothing to write either
+    for value in ("high", "speech"):
+        event = SimpleNamespace(select=SimpleNamespace(id="quality-select"), value=value)
+        config_screen.on_select_changed(event)
+    config_screen.action_start_run()
+    mock_save.assert_not_called()
+
+
+@patch("src.ui.tui.views.config.save_settings", return_value=True)
+def test_action_reset_defaults_before_mount(_mock_save, config_screen: ConfigScreen) -> None:
+    config_screen.settings["defaults"]["quality"] = "high"
+
+    config_screen.action_reset_defaults()
+
+    assert config_screen.settings == default_settings()
+
+
 @patch("src.ui.tui.views.config.save_settings", return_value=True)
 @patch("src.ui.tui.views.config.default_settings")
 def test_action_reset_defaults(mock_defaults, _mock_save, config_screen: ConfigScreen) -> None:
@@ -102,8 +194,14 @@ def test_action_reset_defaults(mock_defaults, _mock_save, config_screen: ConfigS
     }
 
     config_screen.query_one = MagicMock(side_effect=lambda selector, *_: mapping[selector])
+    config_screen.on_mount()
+    config_screen.query_one.reset_mock()
+
     config_screen.action_reset_defaults()
 
+    # Widgets are resolved once on mount, not on every reset
+    config_screen.query_one.assert_not_called()
+
     assert quality_select.value == "high"
     assert provider_select.value == "deepgram"
     assert language_select.value == "es"
@@ -0,0 +1,84 @@
+"""Unit tests for the FilteredDirectoryTree widget."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+textual = pytest.importorskip("textual")
+
+from src.ui.tui.widgets.filtered_tree import MAX_FILTER_RESULTS, FilteredDirectoryTree
+
+
+@pytest.fixture
+def tree() -> FilteredDirectoryTree:
+    # Skip DirectoryTree.__init__, which schedules path watching on a running app
+    tree = FilteredDirectoryTree.__new__(FilteredDirectoryTree)
+    tree._filter_pattern = ""
+    tree._max_results = MAX_FILTER_RESULTS
+    tree._compile_filter("")
+    tree.reload = MagicMock()  # type: ignore[method-assign]
+    return tree
+
+
+PATHS = [Path("/data/Interview.MP3"), Path("/data/notes.txt"), Path("/data/clip.mp4")]
+
+
+def test_filter_paths_without_pattern_returns_input(tree: FilteredDirectoryTree) -> None:
+    assert tree.filter_paths(PATHS) is PATHS
+
+
+def test_filter_paths_substring_is_case_insensitive(tree: FilteredDirectoryTree) -> None:
+    tree.filter = "mp"
+
+    assert list(tree.filter_paths(PATHS)) == [PATHS[0], PATHS[2]]
+
+
+def test_filter_paths_glob_pattern(tree: FilteredDirectoryTree) -> None:
+    tree.filter = "*.txt"
+
+    assert list(tree.filter_paths(PATHS)) == [PATHS[1]]
+    tree.reload.assert_called_once()
+
+
+def test_filter_paths_glob_is_case_insensitive(tree: FilteredDirectoryTree) -> None:
+    tree.filter = "*.mp?"
+
+    assert list(tree.filter_paths(PATHS)) == [PATHS[0], PATHS[2]]
+
+
+def test_filter_paths_glob_error_falls_back_to_substring(tree: FilteredDirectoryTree) -> None:
+    paths = [*PATHS, Path("/data/Why?.wav")]
+
+    with patch("src.ui.tui.widgets.filtered_tree.re.compile", side_effect=re.error("bad pattern")):
+        tree.filter = "why?"
+
+    assert list(tree.filter_paths(paths)) == [paths[-1]]
+
+
+def test_populate_node_caps_filtered_matches_in_sorted_order(
+    tree: FilteredDirectoryTree,
+) -> None:
+    tree.filter = "clip"
+    count = MAX_FILTER_RESULTS + 20
+    # Directory listings come back in arbitrary order; list them newest first
+    listing = [Path(f"/data/clip{index:04d}.wav") for index in reversed(range(count))]
+    node = MagicMock()
+
+    content = sorted(tree.filter_paths(listing), key=lambda path: path.name.lower())
+    tree._populate_node(node, content)
+
+    shown = [call.args[0] for call in node.add.call_args_list]
+    assert shown == [f"clip{index:04d}.wav" for index in range(MAX_FILTER_RESULTS)]
+
+
+def test_populate_node_without_filter_lists_everything(tree: FilteredDirectoryTree) -> None:
+    tree._max_results = 1
+    node = MagicMock()
+
+    tree._populate_node(node, PATHS)
+
+    assert node.add.call_count == len(PATHS)
@@ -0,0 +1,104 @@
+"""Focused unit tests for the HealthPanel widget."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+textual = pytest.importorskip("textual")
+
+from src.ui.tui.widgets.health_panel import HealthPanel
+
+
+@pytest.fixture
+def panel() -> HealthPanel:
+    panel = HealthPanel()
+    panel._health_service = MagicMock()
+    panel._health_service.check_all_providers = AsyncMock(
+        return_value={"deepgram": {"status": "ok", "response_time": 0.5}}
+    )
+    panel.update = MagicMock()  # type: ignore[method-assign]
+    return panel
+
+
+@pytest.mark.asyncio
+async def test_check_health_normalizes_provider_status(panel: HealthPanel) -> None:
+    await panel._check_health()
+
+    status = panel._health_status["deepgram"]
+    assert status["healthy"] is True
+    assert status["message"] == "OK"
+    panel.update.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_recent_results_are_reused_without_rechecking(panel: HealthPanel) -> None:
+    await panel._check_health()
+    await panel._check_health()
+
+    panel._health_service.check_all_providers.assert_awaited_once()
+    panel.update.assert_called_once()  # Same results, nothing re-rendered
+
+    panel._last_check_ts -= 60
+    await panel._check_health()
+    assert panel._health_service.check_all_providers.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_manual_refresh_bypasses_recheck_throttle(panel: HealthPanel) -> None:
+    panel.notify = MagicMock()  # type: ignore[method-assign]
+    await panel._check_health()
+
+    panel.action_refresh()
+    await asyncio.wait_for(panel._check_task, timeout=2)
+
+    assert panel._health_service.check_all_providers.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_display_only_when_rendered_fields_change(panel: HealthPanel) -> None:
+    await panel._check_health()
+
+    panel._last_check_ts -= 60
+    panel._health_service.check_all_providers.return_value = {
+        "deepgram": {"status": "ok", "response_time": 0.501}
+    }
+    await panel._check_health()
+    panel.update.assert_called_once()
+
+    panel._last_check_ts -= 60
+    panel._health_service.check_all_providers.return_value = {
+        "deepgram": {"status": "error", "error": "timeout"}
+    }
+    await panel._check_health()
+    assert panel.update.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_health_skips_while_check_in_flight(panel: HealthPanel) -> None:
+    release = asyncio.Event()
+
+    async def slow_check():
+        await release.wait()
+        return {}
+
+    panel._health_service.check_all_providers = AsyncMock(side_effect=slow_check)
+
+    panel.refresh_health()
+    first_task = panel._check_task
+    panel.refresh_health()
+
+    assert panel._check_task is first_task
+    release.set()
+    await asyncio.wait_for(first_task, timeout=2)
+    panel._health_service.check_all_providers.assert_awaited_once()
+
+
+def test_format_row_colors_and_truncates() -> None:
+    row = HealthPanel._format_row(
+        "whisper", {"healthy": False, "error": "x" * 50, "message": None, "response_time": 6.0}
+    )
+
+    assert row == ("Whisper", "[red]✗ Error[/red]", "[red]6.00s[/red]", "x" * 37 + "...")
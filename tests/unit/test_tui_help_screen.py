@@ -0,0 +1,32 @@
+"""Focused unit tests for the HelpScreen view."""
+
+from __future__ import annotations
+
+from rich.table import Table
+from rich.text import Text
+
+from src.ui.tui.views.help import _RUN_SHORTCUTS, _build_shortcut_table, _help_sections
+
+
+def test_help_sections_are_built_once() -> None:
+    first = _help_sections()
+    second = _help_sections()
+
+    assert first is second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_help_sections_are_rich_renderables() -> None:
+    # Tables must reach Static as Table objects so Rich lays them out at terminal width
+    sections = _help_sections()
+
+    assert sum(isinstance(section, Table) for section in sections) == 4
+    assert all(isinstance(section, Text | Table) for section in sections)
+
+
+def test_shortcut_tables_are_shared_per_row_set() -> None:
+    table = _build_shortcut_table(_RUN_SHORTCUTS)
+
+    assert _build_shortcut_table(_RUN_SHORTCUTS) is table
+    assert table in _help_sections()
+    assert table.row_count == len(_RUN_SHORTCUTS)
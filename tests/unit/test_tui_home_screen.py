@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -28,12 +29,17 @@ class DummyApp:
     def pop_screen(self) -> None:
         self.popped += 1
 
+    def batch_update(self) -> nullcontext[None]:
+        return nullcontext()
+
 
 @pytest.fixture
 def home_screen(tmp_path: Path) -> HomeScreen:
     screen = HomeScreen(start_dir=tmp_path)
     dummy_app = DummyApp(state=AppState(), pushed=[])
     screen.app = dummy_app  # type: ignore[assignment]
+    # Unmounted screens have no running timer loop; capture debounce scheduling instead
+    screen.set_timer = MagicMock()  # type: ignore[method-assign]
     return screen
 
 
@@ -150,6 +156,36 @@ def test_action_refresh_recent_adds_placeholder(mock_load, home_screen: HomeScre
     home_screen.notify.assert_called_with("Recent files refreshed", severity="information")
 
 
+@patch("src.ui.tui.views.home.load_recent_files")
+def test_load_recent_files_adds_keyed_rows_in_one_batch(mock_load, home_screen: HomeScreen) -> None:
+    mock_load.return_value = [
+        {"path": "/media/a.mp3", "size_mb": 1.25, "last_used": "2024-05-01T10:00:00"},
+        {
+            "path": "/media/b.wav",
+            "name": "b.wav",
+            "size_mb": 10.0,
+            "last_used": "2024-04-30T09:30:00",
+        },
+    ]
+    table = _stub_table()
+    calls = []
+    table.clear = lambda: calls.append("clear")
+    table.add_row = lambda *args, **kwargs: calls.append((args, kwargs["key"]))
+    home_screen.query_one = MagicMock(return_value=table)
+    batch = MagicMock()
+    home_screen.app.batch_update = MagicMock(return_value=batch)
+
+    home_screen._load_recent_files()
+
+    home_screen.app.batch_update.assert_called_once()
+    batch.__enter__.assert_called_once()
+    assert calls == [
+        "clear",
+        (("a.mp3", "1.2 MB", "2024-05-01"), "/media/a.mp3"),
+        (("b.wav", "10.0 MB", "2024-04-30"), "/media/b.wav"),
+    ]
+
+
 def test_action_back_pops_screen(home_screen: HomeScreen) -> None:
     home_screen.app.pop_screen = MagicMock()
     home_screen.action_back()
@@ -171,17 +207,54 @@ def test_on_input_changed_sets_filter_dynamically(home_screen: HomeScreen) -> No
     tree = _stub_tree(None)
     home_screen.query_one = MagicMock(return_value=tree)
 
+    def _type(value: str) -> None:
+        event = SimpleNamespace(input=SimpleNamespace(id="filter-input"), value=value)
+        home_screen.on_input_changed(event)
+        # Fire the debounced callback as the timer would
+        home_screen.set_timer.call_args.args[1]()
+
     # Test typing a partial filter
-    event = SimpleNamespace(input=SimpleNamespace(id="filter-input"), value="*.m")
-    home_screen.on_input_changed(event)
+    _type("*.m")
     assert tree.filter == "*.m"
 
     # Test typing more characters
-    event = SimpleNamespace(input=SimpleNamespace(id="filter-input"), value="*.mp")
-    home_screen.on_input_changed(event)
+    _type("*.mp")
     assert tree.filter == "*.mp"
 
     # Test clearing the filter
-    event = SimpleNamespace(input=SimpleNamespace(id="filter-input"), value="")
-    home_screen.on_input_changed(event)
+    _type("")
     assert tree.filter == ""
+
+
+def test_on_input_changed_debounces_filter(home_screen: HomeScreen) -> None:
+    tree = _stub_tree(None)
+    home_screen.query_one = MagicMock(return_value=tree)
+    timers = [MagicMock(), MagicMock(), MagicMock()]
+    home_screen.set_timer.side_effect = timers
+
+    for value in ("a", "ab", "abc"):
+        event = SimpleNamespace(input=SimpleNamespace(id="filter-input"), value=value)
+        home_screen.on_input_changed(event)
+
+    # Nothing is applied until the burst settles; earlier timers are cancelled
+    assert tree.filter == ""
+    timers[0].stop.assert_called_once()
+    timers[1].stop.assert_called_once()
+    timers[2].stop.assert_not_called()
+
+    home_screen.set_timer.call_args.args[1]()
+    assert tree.filter == "abc"
+
+
+def test_widget_lookups_are_cached_until_unmount(home_screen: HomeScreen) -> None:
+    tree = _stub_tree(None)
+    home_screen.query_one = MagicMock(return_value=tree)
+
+    home_screen.action_switch_pane()
+    home_screen.action_switch_pane()
+    home_screen._apply_filter("*.wav")
+    assert home_screen.query_one.call_count == 2  # recent table + file tree
+
+    home_screen.on_unmount()
+    home_screen._apply_filter("")
+    assert home_screen.query_one.call_count == 3
@@ -25,12 +25,14 @@ def test_load_settings_merges_defaults(monkeypatch):
     assert loaded["defaults"]["language"] == defaults["defaults"]["language"]
 
 
-def test_save_settings_writes_file(monkeypatch):
-    target = Path("/tmp/tui_settings.json")
-    monkeypatch.setattr("src.ui.tui.persistence.get_config_dir", lambda: target.parent)
-    m = mock_open()
-    with patch("builtins.open", m):
-        assert persistence.save_settings({"foo": "bar"}) is True
+def test_save_settings_writes_file(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("src.ui.tui.persistence.get_config_dir", lambda: tmp_path)
+
+    assert persistence.save_settings({"foo": "bar"}) is True
+
+    assert json.loads((tmp_path / "tui_settings.json").read_text()) == {"foo": "bar"}
+    # The temp file is renamed into place, not left behind
+    assert list(tmp_path.iterdir()) == [tmp_path / "tui_settings.json"]
 
 
 def test_save_recent_files_handles_missing_config(monkeypatch):
@@ -57,6 +59,9 @@ def test_add_recent_file_inserts_entry(mock_load, mock_save, tmp_path: Path):  #
 
     assert result is True
     assert mock_save.called
+    entry = mock_save.call_args.args[0][0]
+    assert entry["path"] == str(file_path.resolve())
+    assert entry["name"] == "sample.mp3"
 
 
 def test_clear_recent_files_writes_empty(monkeypatch):
@@ -65,3 +70,55 @@ def test_clear_recent_files_writes_empty(monkeypatch):
     m = mock_open()
     with patch("builtins.open", m):
         assert persistence.clear_recent_files() is True
+
+
+def test_load_recent_files_caches_until_saved(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("src.ui.tui.persistence.get_config_dir", lambda: tmp_path)
+    first = tmp_path / "first.mp3"
+    second = tmp_path / "second.mp3"
+    first.write_text("data")
+    second.write_text("data")
+    recent_file = tmp_path / "recent_files.json"
+    recent_file.write_text(json.dumps({"files": [{"path": str(first)}]}))
+
+    assert persistence.load_recent_files() == [{"path": str(first)}]
+
+    # Out-of-band edits are only picked up on a forced reload
+    recent_file.write_text(json.dumps({"files": [{"path": str(second)}]}))
+    assert persistence.load_recent_files() == [{"path": str(first)}]
+    assert persistence.load_recent_files(force=True) == [{"path": str(second)}]
+
+    # Writes through save_recent_files refresh the cache without re-reading
+    assert persistence.save_recent_files([{"path": str(first)}]) is True
+    with patch("builtins.open", side_effect=AssertionError("unexpected read")):
+        assert persistence.load_recent_files() == [{"path": str(first)}]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_recent_files_round_trip(monkeypatch, tmp_path: Path, use_orjson: bool):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("src.ui.tui.persistence.ORJSON_AVAILABLE", use_orjson)
+    monkeypatch.setattr("src.ui.tui.persistence.get_config_dir", lambda: tmp_path)
+    media = tmp_path / "clip.mp3"
+    media.write_text("data")
+    entry = {"path": str(media), "name": "clip.mp3", "size_mb": 0.5, "last_used": "2024-01-01"}
+
+    assert persistence.save_recent_files([entry]) is True
+
+    saved = json.loads((tmp_path / "recent_files.json").read_text(encoding="utf-8"))
+    assert saved == {"files": [entry], "max_entries": 20}
+    assert persistence.load_recent_files(force=True) == [entry]
+
+
+def test_add_recent_file_replaces_entry_for_same_resolved_path(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("src.ui.tui.persistence.get_config_dir", lambda: tmp_path)
+    media = tmp_path / "clip.mp3"
+    media.write_text("data")
+    (tmp_path / "sub").mkdir()
+
+    assert persistence.add_recent_file(media) is True
+    assert persistence.add_recent_file(tmp_path / "sub" / ".." / "clip.mp3") is True
+
+    recent = persistence.load_recent_files(force=True)
+    assert [entry["path"] for entry in recent] == [str(media.resolve())]
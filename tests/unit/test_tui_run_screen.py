@@ -24,6 +24,12 @@ class DummyApp:
         )
         self.notify = MagicMock()
         self.pop_screen = MagicMock()
+        self.workers = MagicMock()
+
+
+def _run_start_pipeline(screen: RunScreen):
+    """Return the pipeline coroutine without going through Textual's worker manager."""
+    return RunScreen._start_pipeline.__wrapped__(screen)  # type: ignore[attr-defined]
 
 
 @pytest.fixture
@@ -47,16 +53,25 @@ def test_ensure_runtime_context_from_state(tmp_path: Path) -> None:
     assert dummy.state.pending_run_config is None
 
 
+def test_config_is_read_only_view(tmp_path: Path) -> None:
+    config = {"output_dir": str(tmp_path)}
+    screen = RunScreen(input_file=tmp_path / "file.mp3", config=config)
+
+    assert screen.config == config
+    with pytest.raises(TypeError):
+        screen.config["output_dir"] = "/elsewhere"  # type: ignore[index]
+
+
 @pytest.mark.asyncio
 async def test_action_cancel_disables_button(run_screen: RunScreen) -> None:
     run_screen._running = True
-    run_screen._pipeline_task = asyncio.create_task(asyncio.sleep(0.1))
     button = MagicMock()
     button.disabled = False
     run_screen._get_button = MagicMock(return_value=button)
 
     await run_screen.action_cancel()
 
+    run_screen.app.workers.cancel_group.assert_called_once_with(run_screen, "pipeline")
     assert run_screen._running is False
     assert button.disabled is True
 
@@ -94,3 +109,148 @@ async def test_run_pipeline_with_events_invokes_service(tmp_path: Path) -> None:
 
     assert mock_run  # ensures patch applied
     assert screen._output_dir == Path(config["output_dir"])
+
+
+def test_update_display_mounts_widgets_once(run_screen: RunScreen) -> None:
+    containers = {"#progress-container": MagicMock(), "#log-container": MagicMock()}
+    run_screen.query_one = MagicMock(side_effect=lambda selector, *_: containers[selector])
+
+    with (
+        patch("src.ui.tui.views.run.ProgressBoard") as board_cls,
+        patch("src.ui.tui.views.run.LogPanel") as panel_cls,
+    ):
+        run_screen._update_display()
+        run_screen._update_display()
+
+    board = board_cls.return_value
+    panel = panel_cls.return_value
+    containers["#progress-container"].mount.assert_called_once_with(board)
+    containers["#log-container"].mount.assert_called_once_with(panel)
+    assert board.update_display.call_count == 2
+    panel.update_logs.assert_called_with(run_screen.app.state)
+
+
+def test_batched_updates_coalesce_into_one_repaint(run_screen: RunScreen) -> None:
+    timer = MagicMock()
+    run_screen.set_interval = MagicMock(return_value=timer)  # type: ignore[method-assign]
+    run_screen._update_display = MagicMock()  # type: ignore[method-assign]
+
+    for _ in range(3):
+        run_screen._schedule_update()
+
+    run_screen.set_interval.assert_called_once()
+    run_screen._flush_update()
+    run_screen._flush_update()
+    run_screen._update_display.assert_called_once()
+
+    run_screen._stop_display_timer()
+    timer.stop.assert_called_once()
+    assert run_screen._display_timer is None
+
+
+@pytest.mark.asyncio
+async def test_start_pipeline_runs_consumer_and_pipeline_to_completion(
+    run_screen: RunScreen,
+) -> None:
+    run_screen._update_display = MagicMock()  # type: ignore[method-assign]
+
+    with patch("src.ui.tui.views.run.run_pipeline", new=AsyncMock()) as mock_run:
+        await asyncio.wait_for(_run_start_pipeline(run_screen), timeout=2)
+
+    mock_run.assert_awaited_once()
+    assert run_screen._event_consumer is None
+    run_screen._update_display.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_start_pipeline_reports_missing_context(run_screen: RunScreen) -> None:
+    run_screen._ensure_runtime_context = MagicMock(  # type: ignore[method-assign]
+        side_effect=RuntimeError("No input file available for RunScreen")
+    )
+
+    with patch("src.ui.tui.views.run.run_pipeline", new=AsyncMock()) as mock_run:
+        await asyncio.wait_for(_run_start_pipeline(run_screen), timeout=2)
+
+    mock_run.assert_not_awaited()
+    assert run_screen._running is False
+    assert run_screen._event_consumer is None
+    message = run_screen.app.notify.call_args
+    assert "No input file available" in message.args[0]
+    assert message.kwargs["severity"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_start_pipeline_reports_consumer_failure(run_screen: RunScreen) -> None:
+    run_screen._update_display = MagicMock()  # type: ignore[method-assign]
+
+    with (
+        patch("src.ui.tui.views.run.run_pipeline", new=AsyncMock()),
+        patch(
+            "src.ui.tui.views.run.EventConsumer.run",
+            new=AsyncMock(side_effect=ValueError("bad batch")),
+        ),
+    ):
+        await asyncio.wait_for(_run_start_pipeline(run_screen), timeout=2)
+
+    assert run_screen._running is False
+    assert run_screen._event_consumer is None
+    errors = [
+        call.args[0]
+        for call in run_screen.app.notify.call_args_list
+        if call.kwargs.get("severity") == "error"
+    ]
+    assert errors == ["Pipeline failed: bad batch"]
+    run_screen._update_display.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_start_pipeline_stops_both_children(run_screen: RunScreen) -> None:
+    run_screen._update_display = MagicMock()  # type: ignore[method-assign]
+    started = asyncio.Event()
+
+    async def hanging_pipeline(**_kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    with patch("src.ui.tui.views.run.run_pipeline", new=hanging_pipeline):
+        task = asyncio.create_task(_run_start_pipeline(run_screen))
+        await asyncio.wait_for(started.wait(), timeout=2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=2)
+
+    assert run_screen._event_consumer is None
+    run_screen._update_display.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_superseded_run_leaves_new_run_display_alone(run_screen: RunScreen) -> None:
+    run_screen._update_display = MagicMock()  # type: ignore[method-assign]
+    started = asyncio.Event()
+
+    async def hanging_pipeline(**_kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    with patch("src.ui.tui.views.run.run_pipeline", new=hanging_pipeline):
+        task = asyncio.create_task(_run_start_pipeline(run_screen))
+        await asyncio.wait_for(started.wait(), timeout=2)
+        newer_consumer = MagicMock()
+        run_screen._event_consumer = newer_consumer  # A new run has started meanwhile
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=2)
+
+    assert run_screen._event_consumer is newer_consumer
+    run_screen._update_display.assert_not_called()
+
+
+def test_update_display_is_skipped_once_screen_is_closed(run_screen: RunScreen) -> None:
+    from textual.css.query import NoMatches
+
+    run_screen.query_one = MagicMock(side_effect=NoMatches())
+
+    run_screen._update_display()
+
+    assert run_screen._w_progress is None
+    assert run_screen._w_logs is None
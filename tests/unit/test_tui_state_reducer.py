@@ -5,7 +5,26 @@ from __future__ import annotations
 import pytest
 
 from src.models.events import Event
-from src.ui.tui.state import AppState, _append_to_ring, apply_event
+from src.ui.tui.state import AppState, LogEntry, _append_to_ring, apply_event
+
+
+class TestLogEntry:
+    """Tests for the LogEntry record."""
+
+    def test_log_entry_is_compact_tuple(self):
+        """Test LogEntry uses tuple layout without a per-instance __dict__."""
+        entry = LogEntry(timestamp=1.0, level="DEBUG", message="hello")
+
+        assert isinstance(entry, tuple)
+        assert not hasattr(entry, "__dict__")
+        assert entry == LogEntry("log", 1.0, "DEBUG", "hello", "")
+
+    def test_log_entry_is_immutable(self):
+        """Test LogEntry fields cannot be reassigned."""
+        entry = LogEntry(message="hello")
+
+        with pytest.raises(AttributeError):
+            entry.message = "changed"  # type: ignore[misc]
 
 
 class TestAppendToRing:
@@ -15,49 +34,69 @@ class TestAppendToRing:
         """Test appending items within max_size limit."""
         items = []
         for i in range(100):
-            items = _append_to_ring(items, {"msg": f"Item {i}"}, max_size=200)
+            items = _append_to_ring(items, LogEntry(message=f"Item {i}"), max_size=200)
 
         assert len(items) == 100
-        assert items[0]["msg"] == "Item 0"
-        assert items[-1]["msg"] == "Item 99"
+        assert items[0].message == "Item 0"
+        assert items[-1].message == "Item 99"
 
     def test_append_exceeds_limit(self):
         """Test ring buffer truncation when exceeding max_size."""
         items = []
         for i in range(3000):
-            items = _append_to_ring(items, {"msg": f"Item {i}"}, max_size=2000)
+            items = _append_to_ring(items, LogEntry(message=f"Item {i}"), max_size=2000)
 
         assert len(items) == 2000
         # Should have truncation marker
-        assert any(item.get("truncated") for item in items)
+        assert any(item.type == "truncated" for item in items)
 
     def test_ring_buffer_keeps_head_and_tail(self):
         """Test that ring buffer preserves first 25% and last 75%."""
         items = []
         for i in range(2100):
-            items = _append_to_ring(items, {"msg": f"Item {i}"}, max_size=2000)
+            items = _append_to_ring(items, LogEntry(message=f"Item {i}"), max_size=2000)
 
         # Should keep first 500 (25% of 2000)
-        assert items[0]["msg"] == "Item 0"
-        assert items[499]["msg"] == "Item 499"
+        assert items[0].message == "Item 0"
+        assert items[499].message == "Item 499"
 
         # Find truncation marker
-        truncation_idx = next(i for i, item in enumerate(items) if item.get("truncated"))
+        truncation_idx = next(i for i, item in enumerate(items) if item.type == "truncated")
         assert truncation_idx == 500
 
         # Should keep last 1499 (75% of 2000 - 1 for marker)
         # Last item should be from original index 2099
-        assert items[-1]["msg"] == "Item 2099"
+        assert items[-1].message == "Item 2099"
 
     def test_ring_buffer_truncation_marker_has_count(self):
         """Test that truncation marker includes count of dropped items."""
         items = []
         for i in range(2500):
-            items = _append_to_ring(items, {"msg": f"Item {i}"}, max_size=2000)
+            items = _append_to_ring(items, LogEntry(message=f"Item {i}"), max_size=2000)
+
+        truncation_marker = next(item for item in items if item.type == "truncated")
+        assert isinstance(truncation_marker, LogEntry)
+        assert truncation_marker.message.endswith("entries truncated")
+        assert int(truncation_marker.message.split()[0]) > 0
 
-        truncation_marker = next(item for item in items if item.get("truncated"))
-        assert "count" in truncation_marker
-        assert truncation_marker["count"] > 0
+    def test_ring_buffer_truncation_is_deterministic(self):
+        """Test the marker takes the oldest dropped entry's timestamp, not the clock."""
+        items = []
+        for i in range(2100):
+            items = _append_to_ring(
+                items, LogEntry(timestamp=float(i), message=f"Item {i}"), max_size=2000
+            )
+
+        truncation_marker = items[500]
+        assert truncation_marker.type == "truncated"
+        assert truncation_marker.timestamp == pytest.approx(500.0)
+
+        replay = []
+        for i in range(2100):
+            replay = _append_to_ring(
+                replay, LogEntry(timestamp=float(i), message=f"Item {i}"), max_size=2000
+            )
+        assert replay == items
 
 
 class TestApplyEventStageStart:
@@ -281,8 +320,9 @@ class TestApplyEventLogs:
 
         # Should be capped at 2000
         assert len(state.logs) <= 2000
-        # Should have truncation marker (which is a dict, not a LogEntry)
-        assert any(isinstance(log, dict) and log.get("truncated") for log in state.logs)
+        # Should have truncation marker (a sentinel LogEntry, keeping the list homogeneous)
+        assert all(isinstance(log, LogEntry) for log in state.logs)
+        assert any(log.type == "truncated" for log in state.logs)
 
 
 class TestApplyEventSummary:
@@ -330,6 +370,46 @@ class TestApplyEventCancelled:
 
         assert "User interrupt" in new_state.current_message
 
+    def test_cancelled_default_message_is_shared(self):
+        """Test default cancel message reuses the module constant."""
+        first = apply_event(AppState(is_running=True), Event(type="cancelled", data={}))
+        second = apply_event(
+            AppState(is_running=True),
+            Event(type="cancelled", data={"reason": "User interrupt"}),
+        )
+
+        assert first.current_message == "Cancelled: User interrupt"
+        assert first.current_message is second.current_message
+
+
+class TestApplyEventNoOp:
+    """Tests for redundant events returning the same state instance."""
+
+    def test_repeated_cancelled_returns_same_state(self):
+        """Test a second identical cancel event does not allocate a new state."""
+        state = AppState(is_running=True, can_cancel=True)
+        event = Event(type="cancelled", data={})
+
+        cancelled = apply_event(state, event)
+        assert cancelled is not state
+        assert apply_event(cancelled, event) is cancelled
+
+    def test_repeated_summary_returns_same_state(self):
+        """Test a duplicate summary event is a no-op."""
+        state = AppState(is_running=True, can_cancel=True)
+        event = Event(type="summary", data={"metrics": {}})
+
+        finished = apply_event(state, event)
+        assert apply_event(finished, event) is finished
+
+    def test_repeated_progress_returns_same_state(self):
+        """Test a progress tick with unchanged numbers is a no-op."""
+        state = AppState(stage_totals={"extract": 100})
+        event = Event(type="stage_progress", stage="extract", data={"completed": 50})
+
+        progressed = apply_event(state, event)
+        assert apply_event(progressed, event) is progressed
+
 
 class TestApplyEventUnknown:
     """Tests for unknown event type handling."""
@@ -432,3 +512,67 @@ class TestApplyEventIntegration:
         assert len(state.stage_durations) == 2
         assert len(state.artifacts) == 2
         assert state.summary["metrics"]["total_duration"] == 13.7
+
+
+class TestResetRunState:
+    """Tests for AppState.reset_run_state."""
+
+    def test_reset_leaves_handed_out_containers_alone(self):
+        """Test reset starts fresh containers instead of emptying shared ones."""
+        summary = {"metrics": {"total_duration": 13.7}}
+        state = apply_event(AppState(), Event(type="summary", data=summary))
+        state = apply_event(state, Event(type="error", data={"message": "boom"}))
+        errors = state.errors
+
+        state.reset_run_state()
+
+        assert state.summary == {} and state.errors == []
+        assert state.summary is not summary
+        assert summary == {"metrics": {"total_duration": 13.7}}
+        assert errors
+
+    def test_stage_start_after_reset(self):
+        """Test first stage_start after reset builds fresh maps without mutating state."""
+        state = AppState(stage_totals={"extract": 100}, stage_completed={"extract": 100})
+        state.reset_run_state()
+
+        new_state = apply_event(
+            state, Event(type="stage_start", stage="transcribe", data={"total": 50})
+        )
+
+        assert new_state.stage_totals == {"transcribe": 50}
+        assert new_state.stage_completed == {"transcribe": 0}
+        assert state.stage_totals == {}
+
+
+class TestStateVersion:
+    """Tests for the AppState version counter."""
+
+    def test_visible_change_bumps_version(self):
+        """Test events that change displayed fields advance the version."""
+        state = AppState()
+
+        state = apply_event(state, Event(type="stage_start", stage="extract", data={"total": 10}))
+        assert state.version == 1
+
+        state = apply_event(state, Event(type="log", data={"message": "hello"}))
+        assert state.version == 2
+
+    def test_no_op_events_keep_version(self):
+        """Test redundant and unknown events leave the version untouched."""
+        state = AppState(is_running=True, can_cancel=True)
+        state = apply_event(state, Event(type="cancelled", data={}))
+        version = state.version
+
+        state = apply_event(state, Event(type="cancelled", data={}))
+        state = apply_event(state, Event(type="unknown_type", data={}))  # type: ignore
+
+        assert state.version == version
+
+    def test_reset_bumps_version(self):
+        """Test in-place reset counts as a visible change."""
+        state = AppState()
+
+        state.reset_run_state()
+
+        assert state.version == 1
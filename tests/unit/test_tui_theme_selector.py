@@ -0,0 +1,79 @@
+"""Focused unit tests for the ThemeSelectorScreen view."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from textual._context import active_app
+
+from src.ui.tui.themes import CUSTOM_THEMES
+from src.ui.tui.views.theme_selector import ThemeSelectorScreen, _format_theme_name
+
+
+@pytest.fixture
+def theme_screen() -> Iterator[ThemeSelectorScreen]:
+    app = SimpleNamespace(theme="nord", available_themes={"nord": None, "textual-light": None})
+    # The app setter publishes the stub as Textual's active app; restore the
+    # previous one on teardown so it doesn't leak into later tests
+    token = active_app.set(app)  # type: ignore[arg-type]
+    screen = ThemeSelectorScreen()
+    screen.app = app  # type: ignore[assignment]
+    yield screen
+    active_app.reset(token)
+
+
+@pytest.mark.parametrize(
+    ("theme_name", "expected"),
+    [
+        ("audio-extraction-blue", "🔵 Blue"),
+        ("audio-extraction-purple", "🟣 Purple"),
+        ("audio-extraction-green", "🟢 Green"),
+        ("audio-extraction-light", "☀️ Light"),
+        ("textual-dark", "Dark"),
+        ("catppuccin-mocha", "Catppuccin Mocha"),
+    ],
+)
+def test_format_theme_name(theme_name: str, expected: str) -> None:
+    assert _format_theme_name(theme_name) == expected
+
+
+def test_format_theme_name_is_memoized() -> None:
+    first = _format_theme_name("tokyo-night")
+
+    assert _format_theme_name("tokyo-night") is first
+    assert _format_theme_name.cache_info().hits >= 1
+
+
+def test_theme_options_group_available_themes(theme_screen: ThemeSelectorScreen) -> None:
+    options = theme_screen._theme_options()
+
+    separators = [str(option.prompt) for option in options if option.disabled]
+    theme_ids = [option.id for option in options if not option.disabled]
+    assert separators == [
+        "──── Custom Themes ────",
+        "──── Built-in Dark Themes ────",
+        "──── Built-in Light Themes ────",
+    ]
+    assert theme_ids == [*(theme.name for theme in CUSTOM_THEMES), "nord", "textual-light"]
+
+
+def test_theme_index_maps_ids_to_option_positions(theme_screen: ThemeSelectorScreen) -> None:
+    options = theme_screen._theme_options()
+
+    assert theme_screen._theme_index
+    for theme_name, index in theme_screen._theme_index.items():
+        assert options[index].id == theme_name
+
+
+def test_highlight_current_theme_uses_index(theme_screen: ThemeSelectorScreen) -> None:
+    theme_screen._theme_options()
+    option_list = MagicMock(highlighted=None)
+    theme_screen.query_one = MagicMock(return_value=option_list)
+
+    theme_screen._highlight_current_theme()
+
+    assert option_list.highlighted == theme_screen._theme_index["nord"]
+    option_list.get_option_at_index.assert_not_called()
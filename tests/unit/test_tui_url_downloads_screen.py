@@ -0,0 +1,53 @@
+"""Focused unit tests for the UrlDownloadsScreen view."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ui.tui.state import AppState
+from src.ui.tui.views.url_downloads import UrlDownloadsScreen
+
+
+@pytest.fixture
+def url_screen() -> UrlDownloadsScreen:
+    screen = UrlDownloadsScreen()
+    screen.app = SimpleNamespace(  # type: ignore[assignment]
+        state=AppState(), push_screen=MagicMock(), pop_screen=MagicMock(), notify=MagicMock()
+    )
+    screen.notify = MagicMock()  # type: ignore[method-assign]
+    return screen
+
+
+def test_start_from_url_stores_url_and_opens_config(url_screen: UrlDownloadsScreen) -> None:
+    url_screen.query_one = MagicMock(return_value=SimpleNamespace(value="  https://x.test/v "))
+
+    url_screen.action_start_from_url()
+
+    assert url_screen.app.state.pending_run_config == {"url": "https://x.test/v"}
+    url_screen.app.push_screen.assert_called_once_with("config")
+
+
+def test_start_from_url_rejects_non_http_urls(url_screen: UrlDownloadsScreen) -> None:
+    url_screen.query_one = MagicMock(return_value=SimpleNamespace(value="ftp://x.test/v"))
+
+    url_screen.action_start_from_url()
+
+    url_screen.notify.assert_called_once_with(
+        "URL must start with http:// or https://", severity="error"
+    )
+    url_screen.app.push_screen.assert_not_called()
+
+
+def test_url_input_lookup_is_cached_until_unmount(url_screen: UrlDownloadsScreen) -> None:
+    url_screen.query_one = MagicMock(return_value=SimpleNamespace(value=""))
+
+    url_screen.action_start_from_url()
+    url_screen.action_start_from_url()
+    assert url_screen.query_one.call_count == 1
+
+    url_screen.on_unmount()
+    url_screen.action_start_from_url()
+    assert url_screen.query_one.call_count == 2
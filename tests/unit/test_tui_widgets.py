@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -10,7 +11,7 @@ import pytest
 textual = pytest.importorskip("textual")
 
 from src.ui.tui.state import AppState, LogEntry
-from src.ui.tui.widgets.log_panel import LogPanel
+from src.ui.tui.widgets.log_panel import LogPanel, _format_message
 from src.ui.tui.widgets.progress_board import ProgressBoard
 
 
@@ -21,7 +22,7 @@ class TestProgressBoard:
         """Test that ProgressBoard initializes correctly."""
         board = ProgressBoard()
 
-        assert board._eta_history == {}
+        assert board._ema_rate == {}
         assert board._last_update == {}
 
     def test_stage_status_pending(self):
@@ -76,7 +77,7 @@ class TestProgressBoard:
         state = AppState()
 
         # Simulate progress updates
-        board._eta_history["extract"] = [1.0, 1.0, 1.0]  # 1 unit/sec
+        board._ema_rate["extract"] = 1.0  # 1 unit/sec
 
         eta = board._calculate_eta(state, "extract", 50, 100)
 
@@ -92,13 +93,36 @@ class TestProgressBoard:
         state = AppState()
 
         # Very slow rate
-        board._eta_history["extract"] = [0.001]  # 0.001 units/sec
+        board._ema_rate["extract"] = 0.001  # 0.001 units/sec
 
         eta = board._calculate_eta(state, "extract", 1, 10000)
 
         # Should cap at 99:59
         assert eta == "99:59"
 
+    def test_eta_calculation_uses_completed_units_per_second(self):
+        """Test the rate comes from progress made, not from how often ETA is asked for."""
+        board = ProgressBoard()
+        state = AppState()
+
+        with patch("src.ui.tui.widgets.progress_board.time.monotonic") as clock:
+            clock.return_value = 100.0
+            assert board._calculate_eta(state, "extract", 10, 100) == "--:--"
+
+            # 20 units in 10s = 2 units/sec, so 70 remaining units take 35s
+            clock.return_value = 110.0
+            assert board._calculate_eta(state, "extract", 30, 100) == "00:35"
+
+            # Repeated ticks without progress reuse the last ETA and add no samples
+            clock.return_value = 111.0
+            assert board._calculate_eta(state, "extract", 30, 100) == "00:35"
+            assert board._ema_rate["extract"] == pytest.approx(2.0)
+
+            # Later samples are blended in: 0.2 * 7 + 0.8 * 2 = 3 units/sec
+            clock.return_value = 112.0
+            assert board._calculate_eta(state, "extract", 44, 100) == "00:18"
+            assert board._ema_rate["extract"] == pytest.approx(3.0)
+
     def test_render_stage_card_pending(self):
         """Test rendering pending stage card."""
         board = ProgressBoard()
@@ -126,6 +150,18 @@ class TestProgressBoard:
         render_text = str(card.renderable)
         assert "50%" in render_text or "█" in render_text
 
+    def test_render_stage_card_clamps_overfull_bar(self):
+        """Test progress past the stage total still renders a full-width bar."""
+        board = ProgressBoard()
+        state = AppState()
+        state.current_stage = "extract"
+        state.stage_completed["extract"] = 150
+        state.stage_totals["extract"] = 100
+
+        card = board._render_stage_card(state, "extract", "Extract Audio")
+
+        assert f"[bold]{'█' * 30}[/bold] 150%" in str(card.renderable)
+
     def test_render_stage_card_complete(self):
         """Test rendering complete stage card."""
         board = ProgressBoard()
@@ -138,6 +174,32 @@ class TestProgressBoard:
         render_text = str(card.renderable)
         assert "3.5" in render_text or "Completed" in render_text
 
+    def test_render_stage_card_reuses_unchanged_cards(self):
+        """Test a card is only rebuilt when something it shows changes."""
+        board = ProgressBoard()
+        state = AppState()
+        state.stage_durations["extract"] = 3.5
+
+        card = board._render_stage_card(state, "extract", "Extract Audio")
+        assert board._render_stage_card(state, "extract", "Extract Audio") is card
+
+        state.stage_durations["extract"] = 4.0
+        assert board._render_stage_card(state, "extract", "Extract Audio") is not card
+
+    def test_update_display_skips_unchanged_state(self):
+        """Test the cards are only rebuilt when rendered fields change."""
+        board = ProgressBoard()
+        board.update = MagicMock()
+        state = AppState()
+
+        board.update_display(state)
+        board.update_display(state)
+        assert board.update.call_count == 1
+
+        state.stage_completed["extract"] = 10
+        board.update_display(state)
+        assert board.update.call_count == 2
+
 
 class TestLogPanel:
     """Tests for LogPanel widget."""
@@ -212,6 +274,33 @@ class TestLogPanel:
         assert len(filtered) == 1
         assert filtered[0].level == "ERROR"
 
+    def test_filter_logs_keeps_truncation_marker(self):
+        """Test truncation markers survive level filtering."""
+        panel = LogPanel()
+        panel._filter_level = "ERROR"
+
+        logs = [
+            LogEntry(timestamp=time.time(), level="INFO", message="Info msg"),
+            LogEntry(type="truncated", message="12 entries truncated"),
+            LogEntry(timestamp=time.time(), level="ERROR", message="Error msg"),
+        ]
+
+        filtered = panel._filter_logs(logs)
+        assert [entry.type for entry in filtered] == ["truncated", "log"]
+
+    def test_filter_logs_keeps_unknown_levels(self):
+        """Test entries with unrecognized levels are never filtered out."""
+        panel = LogPanel()
+        panel._filter_level = "ERROR"
+
+        logs = [
+            LogEntry(timestamp=time.time(), level="WARNING", message="Warning msg"),
+            LogEntry(timestamp=time.time(), level="TRACE", message="Trace msg"),
+        ]
+
+        filtered = panel._filter_logs(logs)
+        assert [entry.level for entry in filtered] == ["TRACE"]
+
     def test_format_timestamp(self):
         """Test timestamp formatting."""
         panel = LogPanel()
@@ -223,6 +312,17 @@ class TestLogPanel:
         assert len(formatted) == 8
         assert formatted.count(":") == 2
 
+    def test_format_timestamp_caches_by_second(self):
+        """Test timestamps within the same second are formatted once."""
+        panel = LogPanel()
+
+        with patch("src.ui.tui.widgets.log_panel.time.strftime", return_value="12:00:00") as fmt:
+            assert panel._format_timestamp(1000.1) == "12:00:00"
+            assert panel._format_timestamp(1000.9) == "12:00:00"
+            panel._format_timestamp(1001.0)
+
+        assert fmt.call_count == 2
+
     def test_format_level(self):
         """Test log level formatting."""
         panel = LogPanel()
@@ -230,12 +330,19 @@ class TestLogPanel:
         formatted = panel._format_level("ERROR")
         assert "ERROR" in str(formatted)
 
-    def test_format_message_truncation(self):
-        """Test message truncation for long messages."""
+    def test_format_level_reuses_cached_text(self):
+        """Test known levels share one Text instance and unknown ones fall back to white."""
         panel = LogPanel()
 
+        assert panel._format_level("WARNING") is panel._format_level("WARNING")
+        unknown = panel._format_level("TRACE")
+        assert str(unknown) == "TRACE  "
+        assert unknown.style == "white"
+
+    def test_format_message_truncation(self):
+        """Test message truncation for long messages."""
         long_msg = "A" * 300
-        formatted = panel._format_message(long_msg)
+        formatted = _format_message(long_msg)
 
         # Should be truncated
         assert len(formatted) <= 203  # 200 + "..."
@@ -243,13 +350,18 @@ class TestLogPanel:
 
     def test_format_message_no_truncation(self):
         """Test message formatting without truncation."""
-        panel = LogPanel()
-
         short_msg = "Short message"
-        formatted = panel._format_message(short_msg)
+        formatted = _format_message(short_msg)
 
         assert formatted == short_msg
 
+    def test_format_message_is_memoized(self):
+        """Test repeated messages are served from the cache."""
+        first = _format_message("B" * 250)
+
+        assert _format_message("B" * 250) is first
+        assert _format_message.cache_info().hits >= 1
+
     def test_action_filter_all(self):
         """Test filter_all action."""
         panel = LogPanel()
@@ -302,3 +414,107 @@ class TestLogPanel:
 
         # Should have all 200 logs (filtering is separate from display limiting)
         assert len(filtered) == 200
+
+    def test_update_logs_formats_only_new_entries(self):
+        """Test repeated updates only format entries appended since the last one."""
+        panel = LogPanel()
+        panel._log_display = MagicMock()
+        panel.scroll_end = MagicMock()
+        state = AppState()
+        state.logs = [LogEntry(timestamp=time.time(), message=f"Log {i}") for i in range(3)]
+
+        with patch(
+            "src.ui.tui.widgets.log_panel._format_message", side_effect=lambda message: message
+        ) as format_message:
+            panel.update_logs(state)
+            panel.update_logs(state)  # Nothing new: no re-render
+            assert panel._log_display.update.call_count == 1
+
+            state.logs = [*state.logs, LogEntry(timestamp=time.time(), message="Log 3")]
+            panel.update_logs(state)
+
+        assert panel._log_display.update.call_count == 2
+        assert format_message.call_count == 4
+        assert [row[2] for row in panel._rows] == ["Log 0", "Log 1", "Log 2", "Log 3"]
+
+    def test_update_logs_rebuilds_on_filter_change_and_reset(self):
+        """Test filter changes and log resets re-render from the full log."""
+        panel = LogPanel()
+        panel._log_display = MagicMock()
+        panel.scroll_end = MagicMock()
+        state = AppState()
+        state.logs = [
+            LogEntry(timestamp=time.time(), level="INFO", message="Info msg"),
+            LogEntry(timestamp=time.time(), level="ERROR", message="Error msg"),
+        ]
+
+        panel.update_logs(state)
+        assert len(panel._rows) == 2
+
+        panel._filter_level = "ERROR"
+        panel.update_logs(state)
+        assert [row[2] for row in panel._rows] == ["Error msg"]
+
+        state.reset_run_state()
+        panel.update_logs(state)
+        assert len(panel._rows) == 0
+        panel._log_display.update.assert_called_with("[dim]No logs to display[/dim]")
+
+    def test_update_logs_scans_only_the_visible_tail(self):
+        """Test a rebuild stops reading the log once the newest matches are found."""
+        panel = LogPanel()
+        panel._log_display = MagicMock()
+        panel.scroll_end = MagicMock()
+        panel._filter_level = "WARNING"
+        levels = ["INFO", "WARNING"] * 150
+        state = AppState()
+        state.logs = [
+            LogEntry(timestamp=time.time(), level=level, message=f"Log {i}")
+            for i, level in enumerate(levels)
+        ]
+        seen = []
+        real_filter = panel._level_filter()
+        panel._level_filter = lambda: lambda entry: seen.append(entry) or real_filter(entry)
+
+        panel.update_logs(state)
+
+        assert len(panel._rows) == LogPanel.MAX_VISIBLE_LOGS
+        assert panel._rows[0][2] == "Log 101"
+        assert panel._rows[-1][2] == "Log 299"
+        assert len(seen) == 2 * LogPanel.MAX_VISIBLE_LOGS - 1
+
+    def test_filter_action_rerenders_mounted_panel(self):
+        """Test changing the filter re-renders immediately instead of waiting for a poll."""
+        panel = LogPanel()
+        panel.notify = MagicMock()
+        panel.update_logs = MagicMock()
+        app = MagicMock(state=AppState())
+
+        with (
+            patch.object(LogPanel, "app", new_callable=PropertyMock, return_value=app),
+            patch.object(LogPanel, "is_mounted", new_callable=PropertyMock, return_value=True),
+        ):
+            panel.action_filter_error()
+
+        assert panel._filter_level == "ERROR"
+        panel.update_logs.assert_called_once_with(app.state)
+
+    def test_refresh_display_skips_ticks_without_state_changes(self):
+        """Test refreshes only re-read logs after a state or filter change."""
+        panel = LogPanel()
+        panel.update_logs = MagicMock()
+        app = MagicMock(state=AppState())
+
+        with patch.object(LogPanel, "app", new_callable=PropertyMock, return_value=app):
+            panel._refresh_display()
+            panel._rendered_filter = panel._filter_level  # As update_logs would record
+            panel._refresh_display()
+            assert panel.update_logs.call_count == 1
+
+            app.state.reset_run_state()  # Bumps the version
+            panel._refresh_display()
+            assert panel.update_logs.call_count == 2
+
+            panel._filter_level = "ERROR"
+            panel._refresh_display()
+            assert panel.update_logs.call_count == 3
@@ -0,0 +1,124 @@
+"""Tests for the interactive CLI wizard flows."""
+
+from unittest.mock import Mock
+
+from src.ui.wizard import _collect_process_flow, _collect_transcribe_flow
+
+
+def _scripted_console(texts, choices, confirmations):
+    """Build a console whose prompts answer from the given lists in order."""
+    console = Mock()
+    console.prompt_text.side_effect = list(texts)
+    console.prompt_choice.side_effect = list(choices)
+    console.prompt_confirmation.side_effect = list(confirmations)
+    return console
+
+
+class TestProcessFlow:
+    """Test argv built by the full pipeline flow."""
+
+    def test_markdown_and_dashboard_options(self, tmp_path):
+        """Test every answered option becomes a flag, in CLI order."""
+        video = tmp_path / "talk.mp4"
+        video.touch()
+        console = _scripted_console(
+            texts=[str(video), "results", "de"],
+            choices=["speech", "whisper", "full", "detailed"],
+            confirmations=[True, False, True, True, True],
+        )
+
+        selection = _collect_process_flow(console)
+
+        assert selection.argv == [
+            "process",
+            str(video),
+            "--output-dir",
+            "results",
+            "--quality",
+            "speech",
+            "--provider",
+            "whisper",
+            "--language",
+            "de",
+            "--analysis-style",
+            "full",
+            "--export-markdown",
+            "--md-template",
+            "detailed",
+            "--md-no-timestamps",
+            "--md-confidence",
+            "--html-dashboard",
+        ]
+
+    def test_empty_answers_are_left_out(self, tmp_path):
+        """Test options answered with an empty value are not passed on."""
+        video = tmp_path / "talk.mp4"
+        video.touch()
+        console = _scripted_console(
+            texts=[str(video), "", ""],
+            choices=["speech", "auto", "concise"],
+            confirmations=[False, False],
+        )
+
+        selection = _collect_process_flow(console)
+
+        assert selection.argv == [
+            "process",
+            str(video),
+            "--quality",
+            "speech",
+            "--provider",
+            "auto",
+            "--analysis-style",
+            "concise",
+        ]
+
+
+class TestTranscribeFlow:
+    """Test argv built by the transcribe flow."""
+
+    def test_markdown_options(self, tmp_path):
+        """Test Markdown answers map to the transcribe command's flags."""
+        audio = tmp_path / "talk.mp3"
+        audio.touch()
+        console = _scripted_console(
+            texts=[str(audio), "out.txt", "en"],
+            choices=["deepgram", "minimal"],
+            confirmations=[True, True, False, False],
+        )
+
+        selection = _collect_transcribe_flow(console)
+
+        assert selection.argv == [
+            "transcribe",
+            str(audio),
+            "--output",
+            "out.txt",
+            "--provider",
+            "deepgram",
+            "--language",
+            "en",
+            "--export-markdown",
+            "--md-template",
+            "minimal",
+            "--md-no-speakers",
+        ]
+
+    def test_markdown_summary(self, tmp_path):
+        """Test the Markdown answers are listed in the confirmation summary."""
+        audio = tmp_path / "talk.mp3"
+        audio.touch()
+        console = _scripted_console(
+            texts=[str(audio), "out.txt", "en"],
+            choices=["auto", "default"],
+            confirmations=[True, True, True, True],
+        )
+
+        selection = _collect_transcribe_flow(console)
+
+        assert selection.summary[-4:] == [
+            ("Markdown template", "default"),
+            ("MD timestamps", "yes"),
+            ("MD speakers", "yes"),
+            ("MD confidence", "yes"),
+        ]
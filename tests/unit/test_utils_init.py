@@ -372,6 +372,21 @@ class TestUtilsPackage:
         assert hasattr(retry, "RetryConfig")
         assert hasattr(retry, "RetryBudget")  # Not in __all__ but in submodule
 
+    def test_sibling_import_does_not_load_retry(self):
+        """Test importing another utils submodule leaves the retry stack unloaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.utils.ffmpeg_utils; "
+            "print('src.utils.retry' in sys.modules, 'tenacity' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
     def test_retry_budget_not_exported(self):
         """Test that RetryBudget is NOT accessible from src.utils (not in __all__)."""
         import src.utils